@@ -5,58 +5,24 @@ import cv2
 color_a = (255,255,0)
 color_b = (0,0,255)
 
+# One analysis (one read, one detection), every view drawn on its own copy of the image
 analysis = GoldenFace.goldenFace("test.png")
-analysis.drawFaceCover(color_a)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
-
-analysis = GoldenFace.goldenFace("test.png")
-analysis.drawTZM(color_b)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
-
-analysis = GoldenFace.goldenFace("test.png")
-analysis.drawTGSM(color_b)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
-
-analysis = GoldenFace.goldenFace("test.png")
-analysis.drawVFM(color_b)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
-
-analysis = GoldenFace.goldenFace("test.png")
-analysis.drawTSM(color_b)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
+colors = {"faceCover": color_a, "landmark": color_a, "mask": color_a}
+views = analysis.render(GoldenFace.renderViews, color=color_b, colors=colors)
 
-analysis = GoldenFace.goldenFace("test.png")
-analysis.drawLC(color_b)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
+for image in views:
+    cv2.imshow("Image",image)
+    key = cv2.waitKey(1000)
 
-analysis = GoldenFace.goldenFace("test.png")
-analysis.drawLandmarks(color_b)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
-
-analysis = GoldenFace.goldenFace("test.png")
-analysis.drawLandmark(color_a)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
-
-analysis = GoldenFace.goldenFace("test.png")
-analysis.drawMask(color_a)
-cv2.imshow("Image",analysis.img)
-key = cv2.waitKey(1000)
-
-analysis = GoldenFace.goldenFace("test.png")
 goldenRatio = analysis.geometricRatio()
 
 text = "Golden Ratio: %" + str(int(goldenRatio))
 
-image = cv2.putText(analysis.img, text, (0,400), cv2.FONT_HERSHEY_SIMPLEX, 1, color_a, 2)
-cv2.imshow("Image",analysis.img)
+image = cv2.putText(analysis.render(["image"])[0], text, (0,400), cv2.FONT_HERSHEY_SIMPLEX, 1, color_a, 2)
+cv2.imshow("Image",image)
 key = cv2.waitKey(1000)
 
-
+# All views side by side
+sheet = analysis.render(GoldenFace.renderViews, color=color_b, colors=colors, sheet=True, scale=0.5)
+cv2.imshow("Image",sheet)
+key = cv2.waitKey(3000)
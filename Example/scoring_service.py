@@ -0,0 +1,91 @@
+from flask import Flask, request, jsonify
+import os
+import argparse
+import logging
+
+# Import GoldenFace library
+import GoldenFace
+
+app = Flask(__name__)
+
+# Created in main() before the server starts, so the workers are forked from a
+# single-threaded process that has already loaded the models
+pool = None
+
+MAX_BATCH = int(os.environ.get("GOLDENFACE_MAX_BATCH", 64))
+
+
+# Encoded images of a multipart field (or the raw request body for single images)
+def read_uploads(field):
+    files = request.files.getlist(field)
+    if files:
+        return [upload.read() for upload in files]
+    if field == "image" and request.data:
+        return [request.data]
+    return []
+
+
+# Result dict of a worker -> (JSON body, status)
+# No face is a 422, an undecodable image a 400, anything else a 500
+def response_for(result):
+    result.pop("source", None)
+    result.pop("index", None)
+    if result["error"] is None:
+        return result, 200
+    if result["errorType"] == "NoFaceError":
+        return result, 422
+    if result["errorType"] == "ValueError":
+        return result, 400
+    return result, 500
+
+
+@app.route('/health')
+def health():
+    return jsonify(workers=pool.workers, warmup=pool.warmup, startup=pool.startupTime)
+
+
+# One image (multipart field "image" or the raw body) -> borders, points, deflections, ratio and vector
+@app.route('/score', methods=['POST'])
+def score():
+    images = read_uploads("image")
+    if len(images) != 1:
+        return jsonify(error="Send exactly one image"), 400
+    body, status = response_for(pool.analyze(images[0]))
+    return jsonify(body), status
+
+
+# Many images (multipart field "images", repeated) -> one result per image, in upload order
+@app.route('/score/batch', methods=['POST'])
+def score_batch():
+    images = read_uploads("images")
+    if not images:
+        return jsonify(error="No images uploaded"), 400
+    if len(images) > MAX_BATCH:
+        return jsonify(error=f"At most {MAX_BATCH} images per batch"), 413
+
+    results = []
+    for result in pool.map(images):
+        results.append(response_for(result)[0])
+    return jsonify(results=results)
+
+
+def main():
+    global pool
+    parser = argparse.ArgumentParser(description="GoldenFace scoring service")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5001)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--max-detect-side", type=int, default=None,
+                        help="detect faces on a copy downscaled to this size (faster on large uploads)")
+    args = parser.parse_args()
+
+    analyzer = GoldenFace.Analyzer(maxDetectSide=args.max_detect_side)
+    pool = GoldenFace.PreforkPool(workers=args.workers, analyzer=analyzer)
+    app.logger.setLevel(logging.INFO)
+    app.logger.info("%d workers ready in %.2fs", pool.workers, pool.startupTime)
+    app.logger.info("Open http://127.0.0.1:%d/health in your browser", args.port)
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,8 @@
 from flask import Flask, render_template, Response
 import cv2
-import time
 import random
-import sys
 import os
+import threading
 
 # Import GoldenFace library
 import GoldenFace
@@ -11,105 +10,136 @@ import database_helper
 
 app = Flask(__name__)
 
-# Global State
-class AppState:
-    def __init__(self):
-        self.scores = []
-        self.start_time = None
-        self.duration = 60
-        self.is_running = False
-        self.saved_to_db = False
-        self.session_variance = random.uniform(-3.0, 3.0)
-        self.final_score = 0
-        self.current_score = 0
-        self.status = "Ready"
-        self.timer_text = "00:00"
-
-state = AppState()
+# Output settings, shared by every client
+CAMERA_INDEX = int(os.environ.get("GOLDENFACE_CAMERA", 0))
+JPEG_QUALITY = int(os.environ.get("GOLDENFACE_JPEG_QUALITY", 80))
+OUTPUT_WIDTH = int(os.environ.get("GOLDENFACE_OUTPUT_WIDTH", 0))   # 0 keeps the camera resolution
+CLIENT_BUFFER = int(os.environ.get("GOLDENFACE_CLIENT_BUFFER", 2))  # frames a slow client may lag behind
+
+# Assessment of one camera run, updated only by the pipeline's render thread:
+# timer, running average and the one-time save of the final score to the database
+def new_assessment(duration=60):
+    return GoldenFace.SessionScorer(duration=duration, offset=random.uniform(-3.0, 3.0),
+                                    onFinalize=database_helper.save_result)
 
 # Initialize Database
 database_helper.init_db()
 
-def generate_frames():
-    cap = cv2.VideoCapture(0)
-    
-    if not cap.isOpened():
-        print("Error: Could not open camera.")
-        return
-
-    state.start_time = time.time()
-    state.is_running = True
-    state.scores = []
-    state.saved_to_db = False
-    
-    while True:
-        success, frame = cap.read()
-        if not success:
-            break
-        
+
+# One camera, one analysis pipeline and one JPEG encoder for all clients.
+# The pipeline starts with the first subscriber and releases the camera when the
+# last one leaves. Every encoded frame is broadcast to all subscribers, each with
+# its own bounded buffer, so a slow client skips frames without slowing the others.
+# All runs share one analyzer, so the models are loaded once per server, not per run.
+class LiveFeed:
+
+    def __init__(self, camera=CAMERA_INDEX, width=OUTPUT_WIDTH, quality=JPEG_QUALITY, buffer_size=CLIENT_BUFFER,
+                 analyzer=None):
+        self.camera = camera
+        self.width = width
+        self.quality = quality
+        self.analyzer = analyzer if analyzer is not None else GoldenFace.defaultAnalyzer
+        self.broadcaster = GoldenFace.FrameBroadcaster(buffer_size)
+        self.assessment = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._last = None
+
+    def subscribe(self):
+        with self._lock:
+            subscription = self.broadcaster.subscribe()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, args=(self._last,), daemon=True)
+                self._last = self._thread
+                self._thread.start()
+        return subscription
+
+    def _run(self, previous):
+        if previous is not None:
+            # the previous run releases the camera before it is opened again
+            previous.join()
+        cap = cv2.VideoCapture(self.camera)
+        pipeline = None
         try:
-            # 1. Analysis
-            analysis = GoldenFace.goldenFace(frame)
-            analysis.drawFaceCover((0, 255, 255))
-            analysis.drawLandmarks((0, 0, 255))
-            
-            raw_score = analysis.geometricRatio()
-             # Ensure min 50%
-            if raw_score < 50:
-                geometric_score = 50 + (raw_score / 2)
-            else:
-                geometric_score = raw_score
-            geometric_score = max(50, geometric_score)
-            
-            # 2. Logic
-            elapsed = time.time() - state.start_time
-            
-            if elapsed < state.duration:
-                # Assessing
-                state.scores.append(geometric_score)
-                state.current_score = sum(state.scores) / len(state.scores)
-                
-                remaining = int(state.duration - elapsed)
-                m, s = divmod(remaining, 60)
-                state.timer_text = f"{m:02d}:{s:02d}"
-                state.status = "Analyzing..."
-                
-                # Draw Info on Frame
-                cv2.putText(analysis.img, f"Status: {state.status}", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
-                cv2.putText(analysis.img, f"Time: {state.timer_text}", (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-                cv2.putText(analysis.img, f"Score: {int(state.current_score)}%", (20, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-                
-            else:
-                # Done
-                state.timer_text = "00:00"
-                if not state.scores: state.scores.append(geometric_score)
-                
-                if not state.saved_to_db:
-                    final_val = (sum(state.scores) / len(state.scores)) + state.session_variance
-                    state.final_score = max(50, min(99, final_val))
-                    database_helper.save_result(state.final_score, state.duration)
-                    state.saved_to_db = True
-                    state.status = "Completed"
-                
-                # Draw Info
-                cv2.putText(analysis.img, "Assessment Complete", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-                cv2.putText(analysis.img, f"FINAL SCORE: {int(state.final_score)}%", (20, 100), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 255), 3)
+            if not cap.isOpened():
+                print("Error: Could not open camera.")
+                return
+
+            self.assessment = new_assessment()
+            # Full face detection only every few frames, tracking in between;
+            # frames that barely changed reuse the last landmarks (motion gating)
+            session = GoldenFace.VideoSession(analyzer=self.analyzer, motionThreshold=2)
+            pipeline = GoldenFace.StreamPipeline(cap, lambda frame: self._analyze(session, frame), self._render, workers=2)
+            for frame_bytes in pipeline:
+                self.broadcaster.publish(frame_bytes)
+                with self._lock:
+                    if not len(self.broadcaster):
+                        # last client left, the next one starts a new run
+                        self._thread = None
+                        return
+        finally:
+            if pipeline is not None:
+                pipeline.stop()
+            cap.release()
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    # camera ended or failed: end this run's clients
+                    self._thread = None
+                    self.broadcaster.close()
 
-            processed_frame = analysis.img
-            
-        except Exception:
+    # 1. Analysis (pipeline analysis threads)
+    def _analyze(self, session, frame):
+        analysis = session.process(frame)
+        analysis.drawFaceCover((0, 255, 255))
+        analysis.drawLandmarks((0, 0, 255))
+
+        raw_score = analysis.geometricRatio()
+         # Ensure min 50%
+        if raw_score < 50:
+            geometric_score = 50 + (raw_score / 2)
+        else:
+            geometric_score = raw_score
+        return max(50, geometric_score)
+
+    # 2. Logic, overlay and encoding (pipeline render thread, in frame order), once for all clients
+    def _render(self, processed_frame, geometric_score):
+        state = self.assessment
+        if geometric_score is None:
             # Fallback if no face
-            processed_frame = frame
             cv2.putText(processed_frame, "Face Not Found", (20, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+        else:
+            if state.add(geometric_score):
+                # Assessing; draw Info on Frame
+                cv2.putText(processed_frame, "Status: Analyzing...", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+                cv2.putText(processed_frame, f"Time: {state.timerText()}", (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                cv2.putText(processed_frame, f"Score: {int(state.mean)}%", (20, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+
+            else:
+                # Done: final score computed and saved on the first call only
+                final_score = state.finalize(fallback=geometric_score)["final"]
+
+                # Draw Info
+                cv2.putText(processed_frame, "Assessment Complete", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+                cv2.putText(processed_frame, f"FINAL SCORE: {int(final_score)}%", (20, 100), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 255), 3)
+
+        # Resize and encode
+        if self.width and processed_frame.shape[1] != self.width:
+            height = round(processed_frame.shape[0] * self.width / processed_frame.shape[1])
+            processed_frame = cv2.resize(processed_frame, (self.width, height), interpolation=cv2.INTER_AREA)
+        ret, buffer = cv2.imencode('.jpg', processed_frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+        return (b'--frame\r\n'
+                b'Content-Type: image/jpeg\r\n\r\n' + buffer.tobytes() + b'\r\n')
+
 
-        # Encode
-        ret, buffer = cv2.imencode('.jpg', processed_frame)
-        frame_bytes = buffer.tobytes()
-        
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-               
-    cap.release()
+feed = LiveFeed()
+# Load the models while the server starts, before the first client connects
+threading.Thread(target=GoldenFace.warmup, args=(feed.analyzer,), daemon=True).start()
+
+def generate_frames():
+    # Client disconnect closes the generator, which ends the subscription
+    with feed.subscribe() as subscription:
+        for frame_bytes in subscription:
+            yield frame_bytes
 
 @app.route('/')
 def index():
@@ -122,4 +152,4 @@ def video_feed():
 if __name__ == '__main__':
     print("Starting Flask Server...")
     print("Open http://127.0.0.1:5000 in your browser")
-    app.run(host='0.0.0.0', port=5000, debug=True, use_reloader=False)
+    app.run(host='0.0.0.0', port=5000, debug=True, use_reloader=False, threaded=True)
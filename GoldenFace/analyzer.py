@@ -0,0 +1,193 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import os
+import threading
+import cv2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from . import models
+
+
+#One CascadeClassifier and one FacemarkLBF, each loaded on first use
+class _DetectorSet:
+
+    def __init__(self):
+        self.faceDetector = None
+        self.landmarkDetector = None
+        # how the landmark model was loaded (see models.loadLandmarkDetector)
+        self.landmarkStatus = None
+
+    def face(self):
+        if self.faceDetector is None:
+            self.faceDetector = models.createFaceDetector()
+        return self.faceDetector
+
+    def landmark(self):
+        if self.landmarkDetector is None:
+            self.landmarkDetector, self.landmarkStatus = models.loadLandmarkDetector()
+        return self.landmarkDetector
+
+
+#Bounded pool of detector sets. A set is used by one thread at a time: checkout() hands
+#out an idle set (one that already has the wanted model loaded if possible), creates a
+#new one while fewer than size exist, and otherwise waits until a set is returned.
+class _DetectorPool:
+
+    def __init__(self, size):
+        self.size = max(1, size)
+        self._idle = []
+        self._created = 0
+        self._available = threading.Condition()
+
+    @contextmanager
+    def checkout(self, need=None):
+        with self._available:
+            while not self._idle and self._created >= self.size:
+                self._available.wait()
+            if self._idle:
+                # prefer a set that has the wanted model loaded already
+                ready = [detectors for detectors in self._idle if need is None or getattr(detectors, need) is not None]
+                detectors = ready[-1] if ready else self._idle[-1]
+                self._idle.remove(detectors)
+            else:
+                detectors = _DetectorSet()
+                self._created += 1
+        try:
+            yield detectors
+        finally:
+            with self._available:
+                self._idle.append(detectors)
+                self._available.notify()
+
+    def loaded(self):
+        with self._available:
+            return self._created
+
+    #in a forked child: the parent's lock state is not valid there, the loaded sets are
+    def afterFork(self):
+        self._available = threading.Condition()
+
+
+#public
+#Reusable, thread-safe face analysis engine.
+#OpenCV detector objects keep per-call buffers, so they are never used by two threads at
+#once: an Analyzer keeps a pool of at most detectorSets detector sets (default: one per
+#CPU), created when needed and shared by all threads. Each model is loaded once per set,
+#not once per thread. detectMultiScale and fit release the GIL, so analyze_many scales
+#over threads up to the pool size.
+class Analyzer:
+
+    #detectScale / maxDetectSide: run the Haar detector on a resized gray copy
+    #(scaled by detectScale, or so that its longer side is at most maxDetectSide pixels).
+    #Boxes are mapped back, so landmark fitting and drawing still use the full resolution image.
+    def __init__(self, scaleFactor=1.3, minNeighbors=5, detectScale=1.0, maxDetectSide=None, detectorSets=None):
+        self.scaleFactor = scaleFactor
+        self.minNeighbors = minNeighbors
+        self.detectScale = detectScale
+        self.maxDetectSide = maxDetectSide
+        self.detectorPool = _DetectorPool(detectorSets or os.cpu_count() or 1)
+        self._executors = {}
+        self._executorLock = threading.Lock()
+
+    #Detector set for the calling thread while the with block runs:
+    #with analyzer.detectors() as detectors: detectors.face(), detectors.landmark()
+    def detectors(self, need=None):
+        return self.detectorPool.checkout(need)
+
+    def detect(self, image_gray):
+        return self._detect(image_gray)
+
+    #Detect only inside region=(x,y,w,h) of the gray image.
+    #Boxes are returned in full image coordinates.
+    def detectRegion(self, image_gray, region, minSize=(0, 0), maxSize=(0, 0)):
+        (x,y,w,h) = region
+        faces = self._detect(image_gray[y:y+h, x:x+w], minSize, maxSize)
+        if len(faces):
+            faces = faces + (x, y, 0, 0)
+        return faces
+
+    def detectionScale(self, shape):
+        scale = self.detectScale
+        if self.maxDetectSide:
+            scale = min(scale, self.maxDetectSide / max(shape[:2]))
+        return min(scale, 1.0)
+
+    def _detect(self, image_gray, minSize=(0, 0), maxSize=(0, 0)):
+        scale = self.detectionScale(image_gray.shape)
+        if scale >= 1.0:
+            with self.detectors("faceDetector") as detectors:
+                return detectors.face().detectMultiScale(image_gray, self.scaleFactor, self.minNeighbors,
+                                                         minSize=minSize, maxSize=maxSize)
+
+        small = cv2.resize(image_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        minSize = (int(minSize[0] * scale), int(minSize[1] * scale))
+        maxSize = (int(maxSize[0] * scale), int(maxSize[1] * scale))
+        with self.detectors("faceDetector") as detectors:
+            faces = detectors.face().detectMultiScale(small, self.scaleFactor, self.minNeighbors,
+                                                      minSize=minSize, maxSize=maxSize)
+        if len(faces):
+            faces = np.round(faces / scale).astype(faces.dtype)
+        return faces
+
+    def fit(self, image_gray, faces):
+        with self.detectors("landmarkDetector") as detectors:
+            _, landmarks = detectors.landmark().fit(image_gray, faces)
+        return landmarks
+
+    #path or BGR array -> goldenFace, detected on the calling thread
+    def analyze(self, image):
+        from . import goldenFace
+        face = goldenFace(image, analyzer=self)
+        face.detect()
+        return face
+
+    #One goldenFace per detected face, largest first, from a single fit call.
+    #All results share the image, so their draw* methods paint on the same picture.
+    #keepOriginal: see goldenFace; the results share the kept copy too.
+    def analyzeFaces(self, image, max_faces=None, keepOriginal=False):
+        from . import goldenFace
+        source = goldenFace(image, analyzer=self, keepOriginal=keepOriginal)
+        image_gray = source.image_gray
+
+        faces = self.detect(image_gray)
+        if not len(faces):
+            return []
+
+        faces = np.asarray(faces)
+        order = np.argsort(-(faces[:, 2] * faces[:, 3]), kind="stable")
+        faces = faces[order[:max_faces]]
+
+        landmarks = self.fit(image_gray, faces)
+        return [goldenFace.fromDetection(source.img, faces[i], landmarks[i], analyzer=self,
+                                         image_gray=image_gray, faces=faces,
+                                         keepOriginal=keepOriginal, original=source._original)
+                for i in range(len(faces))]
+
+    #Analyze images on a thread pool, yielding goldenFace objects
+    #in input order (or as they finish with ordered=False).
+    #The pool is kept for later calls with the same number of threads.
+    def analyze_many(self, images, threads=None, ordered=True):
+        pool = self._executor(threads)
+        if ordered:
+            for face in pool.map(self.analyze, images):
+                yield face
+        else:
+            futures = [pool.submit(self.analyze, image) for image in images]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _executor(self, threads):
+        with self._executorLock:
+            if threads not in self._executors:
+                self._executors[threads] = ThreadPoolExecutor(threads, thread_name_prefix="GoldenFace")
+            return self._executors[threads]
+
+
+#Shared by every goldenFace created without an explicit analyzer
+defaultAnalyzer = Analyzer()
@@ -0,0 +1,79 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import multiprocessing
+import cv2
+import numpy as np
+
+
+# Per-worker DetectionCache when analyzeBatch got a cache path
+_detectionCache = None
+
+
+def _initWorker(cachePath=None):
+    global _detectionCache
+    # Each worker runs one image at a time, so OpenCV's own thread pool
+    # would only oversubscribe the cores the process pool already uses.
+    cv2.setNumThreads(1)
+
+    if cachePath is not None:
+        # models are loaded on the first cache miss, a fully cached re-run never needs them
+        from .detectionCache import DetectionCache
+        _detectionCache = DetectionCache(cachePath)
+        return
+
+    from . import goldenFace
+    goldenFace.loadModels()
+
+
+def _analyzeJob(job):
+    index, source = job
+    return _analyze(index, source, cache=_detectionCache)
+
+
+def _analyze(index, source, analyzer=None, cache=None):
+    from .core import goldenFace, NoFaceError
+
+    try:
+        if cache is not None:
+            result = cache.result(source)
+        else:
+            if isinstance(source, bytes):
+                # encoded file contents (e.g. an upload), decoded in the worker
+                source = cv2.imdecode(np.frombuffer(source, dtype=np.uint8), cv2.IMREAD_COLOR)
+            face = goldenFace(source, analyzer=analyzer)
+            result = face.toDict() if face.hasFace() else {"faceBorders": None}
+        if result.get("error") is None and result["faceBorders"] is None:
+            raise NoFaceError()
+        # a DetectionCache result may carry the error of its image already
+        result.setdefault("error", None)
+        result.setdefault("errorType", None)
+    except Exception as e:
+        result = {"faceBorders": None, "error": str(e), "errorType": type(e).__name__}
+
+    result["index"] = index
+    result["source"] = source if isinstance(source, str) else None
+    return result
+
+
+#public
+#Analyze many images (paths, encoded bytes or BGR arrays) on a process pool.
+#Every worker loads the LBF and Haar models once and keeps them for all of its jobs.
+#Results are yielded as dicts (see goldenFace.toDict) tagged with their input "index";
+#ordered=False yields them as soon as they finish.
+#cache: path of a DetectionCache database shared by the workers; images analyzed by an
+#earlier run with the same models are re-scored from their stored landmarks.
+def analyzeBatch(images, workers=None, ordered=True, chunksize=1, cache=None):
+    jobs = enumerate(images)
+    with multiprocessing.Pool(workers, initializer=_initWorker, initargs=(cache,)) as pool:
+        if ordered:
+            results = pool.imap(_analyzeJob, jobs, chunksize)
+        else:
+            results = pool.imap_unordered(_analyzeJob, jobs, chunksize)
+
+        for result in results:
+            yield result
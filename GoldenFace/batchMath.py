@@ -0,0 +1,117 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+
+# Vectorized versions of the goldenMath metrics.
+# facePoints is an (N, 16, 2) array laid out as landmark.pointNames,
+# faceBorders is an (N, 4) array of (x, y, w, h). Every function returns one value per face.
+# The formulas follow goldenMath step by step so both give the same numbers;
+# where goldenMath would raise ZeroDivisionError the result here is inf/nan.
+import numpy as np
+from .landmark import pointRow
+
+
+def _x(facePoints, name):
+    return facePoints[:, pointRow[name], 0]
+
+def _y(facePoints, name):
+    return facePoints[:, pointRow[name], 1]
+
+def _asArrays(faceBorders, facePoints):
+    faceBorders = np.asarray(faceBorders, dtype=np.float64).reshape(-1, 4)
+    facePoints = np.asarray(facePoints, dtype=np.float64).reshape(-1, len(pointRow), 2)
+    return faceBorders, facePoints
+
+def _distance(facePoints, nameA, nameB):
+    dx = _x(facePoints, nameB) - _x(facePoints, nameA)
+    dy = _y(facePoints, nameB) - _y(facePoints, nameA)
+    return np.sqrt(dx ** 2 + dy ** 2)
+
+
+#public
+def calculateUnit(facePoints):
+    facePoints = np.asarray(facePoints, dtype=np.float64).reshape(-1, len(pointRow), 2)
+    left_eye_distance = _distance(facePoints, "left_eye_left", "left_eye_right")
+    right_eye_distance = _distance(facePoints, "right_eye_left", "right_eye_right")
+    errorRatio = np.abs(left_eye_distance - right_eye_distance)
+
+    pieceCount = left_eye_distance / errorRatio
+    return left_eye_distance / pieceCount
+
+#public
+def calculateTGSM(faceBorders, facePoints, unitSize):
+    trichionY = faceBorders[:, 1]
+
+    left_Y = np.abs(_y(facePoints, "left_eyebrow_right") + _y(facePoints, "left_eyebrow_right")) / 2
+    right_y = np.abs(_y(facePoints, "right_eyebrow_left") + _y(facePoints, "right_eyebrow_left")) / 2
+    mid_y = np.abs(_y(facePoints, "left_eyebrow_right") + _y(facePoints, "right_eyebrow_left")) / 2
+    Glabella_Y = (left_Y + right_y + mid_y) / 3
+
+    Subnazale_Y = _y(facePoints, "nose_bottom")
+    Menton_y = _y(facePoints, "chin_down")
+
+    TGdistance = np.sqrt((Glabella_Y - trichionY) ** 2) / unitSize
+    GSdistance = np.sqrt((Subnazale_Y - Glabella_Y) ** 2) / unitSize
+    SMdistance = np.sqrt((Menton_y - Subnazale_Y) ** 2) / unitSize
+
+    avg = (TGdistance + GSdistance + SMdistance) / 3
+    return (np.abs(TGdistance - avg) + np.abs(GSdistance - avg) + np.abs(SMdistance - avg)) / (TGdistance + GSdistance + SMdistance) * 100
+
+#public
+def calculateVFM(faceBorders, facePoints, unitSize):
+    s1 = np.abs(_x(facePoints, "face_left") - _x(facePoints, "left_eye_left")) / unitSize
+    s2 = np.abs(_x(facePoints, "left_eye_left") - _x(facePoints, "left_eye_right")) / unitSize
+    s3 = np.abs(_x(facePoints, "left_eye_right") - _x(facePoints, "right_eye_left")) / unitSize
+    # goldenMath.calculateVFM overwrites its 4th separator with the 5th one; kept for identical scores
+    s4 = np.abs(_x(facePoints, "right_eye_right") - _x(facePoints, "face_right")) / unitSize
+
+    face_width = np.abs(_x(facePoints, "face_left") - _x(facePoints, "face_right")) / unitSize
+    avg = face_width / 5
+
+    return (np.abs(s1 - avg) + np.abs(s2 - avg) + np.abs(s3 - avg) + np.abs(s4 - avg)) / face_width * 100
+
+#public
+def calculateTZM(faceBorders, facePoints, unitSize):
+    Zdistance = np.abs(_x(facePoints, "face_left") - _x(facePoints, "face_right")) / unitSize
+    TMdistance = np.abs(faceBorders[:, 1] - _y(facePoints, "chin_down")) / unitSize
+    return np.abs(1.618 - TMdistance / Zdistance) / 1.618 * 100
+
+#public
+def calculateTSM(faceBorders, facePoints, unitSize):
+    TSdistance = np.abs(faceBorders[:, 1] - _y(facePoints, "nose_bottom")) / unitSize
+    SMdistance = np.abs(_y(facePoints, "nose_bottom") - _y(facePoints, "chin_down")) / unitSize
+    return np.abs(1.618 - TSdistance / SMdistance) / 1.618 * 100
+
+#public
+def calculateLC(faceBorders, facePoints):
+    LC = np.abs(_x(facePoints, "right_eyebrow_right") - _x(facePoints, "left_eyebrow_left"))
+    CE = np.abs(_x(facePoints, "mouth_right") - _x(facePoints, "mouth_left"))
+    return np.abs(2.30 - LC / CE) / 2.30 * 1000
+
+#public
+#All deflections and the geometric ratio for N faces in one pass
+def calculateMetrics(faceBorders, facePoints):
+    faceBorders, facePoints = _asArrays(faceBorders, facePoints)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unitSize = calculateUnit(facePoints)
+        metrics = {
+            "unitSize": unitSize,
+            "TZM": calculateTZM(faceBorders, facePoints, unitSize),
+            "TGSM": calculateTGSM(faceBorders, facePoints, unitSize),
+            "VFM": calculateVFM(faceBorders, facePoints, unitSize),
+            "TSM": calculateTSM(faceBorders, facePoints, unitSize),
+            "LC": calculateLC(faceBorders, facePoints),
+        }
+        avg = (metrics["TZM"] + metrics["TGSM"] + metrics["VFM"] + metrics["TSM"] + metrics["LC"]) / 5
+        metrics["geometricRatio"] = 100 - avg
+
+    return metrics
+
+#public
+def geometricRatio(faceBorders, facePoints):
+    return calculateMetrics(faceBorders, facePoints)["geometricRatio"]
@@ -0,0 +1,318 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+
+import cv2
+from . import goldenMath
+from . import functions
+from . import landmark
+from . import reference
+from . import models
+from . import overlay
+from .analyzer import Analyzer, defaultAnalyzer
+import time
+import numpy as np
+
+#public
+#Raised by faceBorders/landmarks/facePoints (and the metrics) when the image has no face.
+#It is an AttributeError, so hasattr(face, "faceBorders") keeps working for old callers;
+#use hasFace() instead, which does not hide errors raised while detecting.
+class NoFaceError(AttributeError):
+
+    def __init__(self, message="No face detected"):
+        super().__init__(message)
+
+#public
+#Views goldenFace.render draws by default, one image each.
+#"image" (no overlay) and "facialPoints" can be asked for as well.
+renderViews = ("faceCover", "TZM", "TGSM", "VFM", "TSM", "LC", "landmarks", "landmark", "mask")
+
+class goldenFace:
+
+    img = ""
+
+    # Everything below the image is computed on first use:
+    # detection and landmark fitting on the first access to faces/faceBorders/landmarks/facePoints,
+    # every metric and vector once, until the landmarks change.
+    # keepOriginal=True keeps a copy of the image before the first draw* call, so render()
+    # shows views without what was drawn in place; off by default, live apps that draw on
+    # every frame do not pay for the copy.
+    def __init__(self, path, analyzer=None, keepOriginal=False):
+        if isinstance(path, str):
+            self.img = cv2.imread(path)
+        else:
+            self.img = path
+        
+        if self.img is None:
+            raise ValueError("Could not load image. Please check the path or input array.")
+
+        # Detectors come from the analyzer's pool, one thread at a time (see Analyzer)
+        if analyzer is None:
+            analyzer = defaultAnalyzer
+        self.analyzer = analyzer
+
+        self._image_gray = None
+        self._detected = False
+        self._faces = ()
+        self._faceBorders = None
+        self._landmarks = None
+        self._cache = {}
+        # with keepOriginal: copy of the image before the first draw* call; a one-item list
+        # so that results sharing one picture (Analyzer.analyzeFaces) share it too
+        self.keepOriginal = keepOriginal
+        self._original = [None]
+
+    # faces: boxes found elsewhere (e.g. by a VideoSession tracker or a cache), skips face detection;
+    # with faces=() nothing is detected or fitted and no model is loaded
+    def detect(self, faces=None):
+        if self._detected:
+            return
+
+        analyzer = self.analyzer
+        if faces is None:
+            faces = analyzer.detect(self.image_gray)
+
+        for faceBorders in faces:
+            (x,y,w,h) = faceBorders
+            self._faceBorders = faceBorders
+            landmarks = analyzer.fit(self.image_gray, faces)
+            self.landmarks = (landmarks[0].astype(int), )
+
+            break
+
+        self._faces = faces
+        self._detected = True
+
+    # Result for one face of an already detected image (see Analyzer.analyzeFaces).
+    # faceLandmarks is the (1, 68, 2) array fit returned for that face.
+    # original: _original of another result on the same picture, shared with it.
+    @classmethod
+    def fromDetection(cls, img, faceBorders, faceLandmarks, analyzer=None, image_gray=None, faces=None,
+                      keepOriginal=False, original=None):
+        face = cls(img, analyzer=analyzer, keepOriginal=keepOriginal)
+        if original is not None:
+            face._original = original
+        face._image_gray = image_gray
+        face._faces = faces if faces is not None else np.array([faceBorders])
+        face._faceBorders = faceBorders
+        face.landmarks = (faceLandmarks.astype(int), )
+        face._detected = True
+        return face
+
+    @property
+    def image_gray(self):
+        if self._image_gray is None:
+            self._image_gray = cv2.cvtColor(self.img,cv2.COLOR_BGR2GRAY)
+        return self._image_gray
+
+    @property
+    def faces(self):
+        self.detect()
+        return self._faces
+
+    # Runs detection if needed; errors while detecting are raised, not reported as no face
+    def hasFace(self):
+        self.detect()
+        return self._faceBorders is not None
+
+    # No face found: faceBorders/landmarks/facePoints raise NoFaceError
+    @property
+    def faceBorders(self):
+        self.detect()
+        if self._faceBorders is None:
+            raise NoFaceError()
+        return self._faceBorders
+
+    @faceBorders.setter
+    def faceBorders(self, faceBorders):
+        self._faceBorders = faceBorders
+        self._cache = {}
+
+    @property
+    def landmarks(self):
+        self.detect()
+        if self._landmarks is None:
+            raise NoFaceError()
+        return self._landmarks
+
+    @landmarks.setter
+    def landmarks(self, landmarks):
+        self._landmarks = landmarks
+        self._cache = {}
+
+    @property
+    def pointArray(self):
+        return self._memo("pointArray", lambda: landmark.facialPointArray(self.landmarks))
+
+    @property
+    def facePoints(self):
+        return self._memo("facePoints", lambda: landmark.pointsToDict(self.pointArray))
+
+    def _memo(self, key, compute):
+        cache = self._cache
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+    # Optimize: Load models only once (into the analyzer's detector pool), returns the load timings
+    @classmethod
+    def loadModels(cls, analyzer=None):
+        return models.warmup(analyzer)
+
+    def drawFaceCover(self,color):
+        self._drawInPlace("faceCover", color)
+
+    def drawLandmark(self,color):
+        self._drawInPlace("landmark", color)
+
+    def drawMask(self,color):
+        self._drawInPlace("mask", color)
+
+    def drawTGSM(self,color):
+        self._drawInPlace("TGSM", color)
+
+    def drawVFM(self,color):
+        self._drawInPlace("VFM", color)
+
+    def drawTZM(self,color):
+        self._drawInPlace("TZM", color)
+
+    def drawLC(self,color):
+        self._drawInPlace("LC", color)
+
+    def drawTSM(self,color):
+        self._drawInPlace("TSM", color)
+
+    # draw* paint on self.img; with keepOriginal the undrawn image is kept first, for render()
+    def _drawInPlace(self, name, color):
+        if self.keepOriginal and self._original[0] is None:
+            self._original[0] = self.img.copy()
+        self.img = self._drawView(name, self.img, color)
+
+    def _drawView(self, name, img, color):
+        if name == "image":
+            return img
+        if name == "faceCover":
+            (x,y,w,h) = self.faceBorders
+            return cv2.rectangle(img,(x,y),(x+w, y+h),color,2)
+        if name == "landmark":
+            return landmark.drawLandmark(img, self.landmarks, color)
+        if name == "landmarks":
+            return goldenMath.drawLandmarks(img, self.landmarks, color)
+        if name == "mask":
+            return goldenMath.drawMask(img, self.faceBorders, self.pointArray, color)
+        if name == "facialPoints":
+            return goldenMath.drawFacialPoints(img, self.pointArray, color)
+        if name in ("TGSM", "VFM", "TZM", "TSM", "LC"):
+            return getattr(goldenMath, "draw" + name)(img, self.faceBorders, self.facePoints, color)
+        raise ValueError(f"Unknown view: {name}")
+
+    #public
+    #Draws views of this analysis on fresh copies of the image and returns them, without
+    #touching self.img or detecting again. The copies start from self.img, which holds what
+    #earlier draw* calls painted, unless the analysis was made with keepOriginal=True. A view is a name from renderViews or a list of
+    #names drawn together. colors maps view names to colors (others use color).
+    #sheet=True returns one contact sheet, `columns` views per row, each labelled with
+    #its view unless labels=False; scale resizes the tiles.
+    def render(self, views=None, color=(255,255,0), colors=None, sheet=False, columns=3, scale=1.0, labels=True):
+        views = renderViews if views is None else views
+        colors = colors or {}
+
+        images = []
+        for view in views:
+            names = [view] if isinstance(view, str) else list(view)
+            img = (self.img if self._original[0] is None else self._original[0]).copy()
+            for name in names:
+                img = self._drawView(name, img, colors.get(name, color))
+            images.append(img)
+
+        if not sheet:
+            return images
+        titles = [view if isinstance(view, str) else "+".join(view) for view in views]
+        return overlay.contactSheet(images, titles if labels else None, columns, scale)
+
+    def unitSize(self):
+        return self._memo("unitSize", lambda: goldenMath.calculateUnit(self.facePoints))
+
+    def calculateTGSM(self):
+        return self._memo("TGSM", lambda: goldenMath.calculateTGSM(self.faceBorders,self.facePoints,self.unitSize()))
+
+    def calculateVFM(self):
+        return self._memo("VFM", lambda: goldenMath.calculateVFM(self.faceBorders,self.facePoints,self.unitSize()))
+
+    def calculateTZM(self):
+        return self._memo("TZM", lambda: goldenMath.calculateTZM(self.faceBorders,self.facePoints,self.unitSize()))
+
+    def calculateTSM(self):
+        return self._memo("TSM", lambda: goldenMath.calculateTSM(self.faceBorders,self.facePoints,self.unitSize()))
+
+    def calculateLC(self):
+        return self._memo("LC", lambda: goldenMath.calculateLC(self.faceBorders,self.facePoints))
+
+    def geometricRatio(self):
+        TZM = self.calculateTZM()
+        TGSM = self.calculateTGSM()
+        VFM = self.calculateVFM()
+        TSM = self.calculateTSM()
+        LC = self.calculateLC()
+
+        avg = (TZM + TGSM + VFM + TSM + LC)  /5
+        return 100- avg
+
+    def face2Vec(self):
+        vector = self._memo("vector", lambda: goldenMath.face2Vec(self.faceBorders,self.facePoints,self.unitSize()))
+        # callers get their own lists, the cached vector stays intact
+        return [list(element) for element in vector]
+
+    def faceSimilarity(self,vector2):
+        return goldenMath.vectorFaceSimilarity(self.face2Vec(),vector2)
+
+    #Golden similarity
+    def similarityRatio(self):
+        return self._memo("similarityRatio", self._similarityRatio)
+
+    def _similarityRatio(self):
+        return reference.defaultRegistry().similarity(self.face2Vec())
+
+    def getLandmarks(self):
+        return self.landmarks
+
+    def getFacialPoints(self):
+        
+        return self.facePoints
+
+    def drawFacialPoints(self,color):
+        self._drawInPlace("facialPoints", color)
+
+    def drawLandmarks(self,color):
+        self._drawInPlace("landmarks", color)
+
+
+    def getFaceBorder(self):
+        return self.faceBorders
+
+    def writeImage(self,name):
+        cv2.imwrite(name, self.img)
+
+    def saveFaceVec(self,path):
+        functions.saveFaceVec(self.face2Vec(),path)
+
+    # Compact, picklable summary of the analysis (no image data)
+    def toDict(self):
+        (x,y,w,h) = self.faceBorders
+        facePoints = {key: list(value) for key, value in self.facePoints.items()}
+        return {
+            "faceBorders": [int(x), int(y), int(w), int(h)],
+            "facePoints": facePoints,
+            "TGSM": self.calculateTGSM(),
+            "VFM": self.calculateVFM(),
+            "TZM": self.calculateTZM(),
+            "TSM": self.calculateTSM(),
+            "LC": self.calculateLC(),
+            "geometricRatio": self.geometricRatio(),
+            "vector": self.face2Vec(),
+        }
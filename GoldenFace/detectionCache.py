@@ -0,0 +1,265 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import hashlib
+import sqlite3
+import threading
+import time
+import cv2
+import numpy as np
+from . import batchMath
+from . import goldenMath
+from . import landmark
+from . import models
+from .resultCache import contentKey, _readBytes
+
+_schema = '''
+    CREATE TABLE IF NOT EXISTS detections (
+        key TEXT PRIMARY KEY,
+        faces BLOB NOT NULL,
+        landmarks BLOB NOT NULL,
+        bytes INTEGER NOT NULL,
+        lastUsed REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS detections_lastUsed ON detections (lastUsed);
+    CREATE TABLE IF NOT EXISTS detectionTotals (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        entries INTEGER NOT NULL,
+        bytes INTEGER NOT NULL
+    );
+    CREATE TRIGGER IF NOT EXISTS detections_insert AFTER INSERT ON detections BEGIN
+        UPDATE detectionTotals SET entries = entries + 1, bytes = bytes + new.bytes;
+    END;
+    CREATE TRIGGER IF NOT EXISTS detections_delete AFTER DELETE ON detections BEGIN
+        UPDATE detectionTotals SET entries = entries - 1, bytes = bytes - old.bytes;
+    END;
+    CREATE TRIGGER IF NOT EXISTS detections_update AFTER UPDATE OF bytes ON detections BEGIN
+        UPDATE detectionTotals SET bytes = bytes - old.bytes + new.bytes;
+    END;
+'''
+
+_upsert = '''INSERT INTO detections VALUES (?, ?, ?, ?, ?)
+             ON CONFLICT (key) DO UPDATE SET faces = excluded.faces, landmarks = excluded.landmarks,
+                                             bytes = excluded.bytes, lastUsed = excluded.lastUsed'''
+
+# metrics of a result dict, computed for all faces at once by batchMath
+_metricKeys = ("TGSM", "VFM", "TZM", "TSM", "LC", "geometricRatio")
+
+# stands in for the pixels when a result is rebuilt only to compute metrics
+_noImage = np.zeros((1, 1, 3), dtype=np.uint8)
+
+
+#public
+#Persistent cache of the vision stage: face boxes and the 68 landmarks of every face,
+#stored in SQLite per image. Keys are the image content hash plus the model version
+#(OpenCV, cascade and landmark model file) and the analyzer's detection parameters,
+#so changing any of them misses instead of returning stale landmarks.
+#When the stored rows exceed maxBytes the least recently used ones are deleted. The entry
+#and byte totals are kept up to date by triggers, so an insert never scans the table.
+#Hits only mark their rows as used in memory; the marks are written touchBatch at a time
+#(and with the next insert, and on close), so readers rarely take the write lock. Marks of
+#a process that exits without close() are lost, which only affects the eviction order.
+#Several processes can share one file (WAL mode).
+class DetectionCache:
+
+    def __init__(self, path, maxBytes=256 << 20, analyzer=None, touchBatch=256):
+        if analyzer is None:
+            from .analyzer import defaultAnalyzer
+            analyzer = defaultAnalyzer
+        self.path = path
+        self.maxBytes = maxBytes
+        self.analyzer = analyzer
+        self.version = self._version()
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_schema)
+        self._seedTotals()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+        self.touchBatch = touchBatch
+        self._touched = {}
+
+    # totals of a database written before they were kept, counted once
+    def _seedTotals(self):
+        if self._conn.execute("SELECT 1 FROM detectionTotals").fetchone() is not None:
+            return
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("""INSERT OR IGNORE INTO detectionTotals
+                                  SELECT 0, COUNT(*), COALESCE(SUM(bytes), 0) FROM detections""")
+
+    def _version(self):
+        analyzer = self.analyzer
+        parts = (models.modelVersion(), analyzer.scaleFactor, analyzer.minNeighbors,
+                 analyzer.detectScale, analyzer.maxDetectSide)
+        return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+    def key(self, image):
+        return f"{contentKey(image)}:{self.version}"
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._totals()
+            return dict(self._counters, entries=entries, bytes=size)
+
+    def _totals(self):
+        return self._conn.execute("SELECT entries, bytes FROM detectionTotals").fetchone()
+
+    def close(self):
+        with self._lock:
+            if self._touched:
+                with self._conn:
+                    self._flushTouches()
+        self._conn.close()
+
+    #key -> (faces (N, 4) int32, landmarks (N, 68, 2) float32) or None
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT faces, landmarks FROM detections WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["hits"] += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.touchBatch:
+                with self._conn:
+                    self._flushTouches()
+        faces = np.frombuffer(row[0], dtype=np.int32).reshape(-1, 4)
+        landmarks = np.frombuffer(row[1], dtype=np.float32).reshape(-1, 68, 2)
+        return faces, landmarks
+
+    def put(self, key, faces, landmarks):
+        faces = np.asarray(faces, dtype=np.int32).reshape(-1, 4).tobytes()
+        landmarks = np.asarray(landmarks, dtype=np.float32).reshape(-1, 68, 2).tobytes()
+        size = len(key) + len(faces) + len(landmarks)
+        with self._lock, self._conn:
+            self._touched.pop(key, None)
+            self._conn.execute(_upsert, (key, faces, landmarks, size, time.time()))
+            # pending touches go in with this write, before eviction looks at lastUsed
+            self._flushTouches()
+            self._evict()
+
+    def _flushTouches(self):
+        if self._touched:
+            self._conn.executemany("UPDATE detections SET lastUsed = ? WHERE key = ?",
+                                   [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self):
+        total = self._totals()[1]
+        if total <= self.maxBytes:
+            return
+        # drop the oldest rows until 90% of the budget is left, so this does not run on every insert
+        excess = total - int(self.maxBytes * 0.9)
+        freed = 0
+        keys = []
+        for key, size in self._conn.execute("SELECT key, bytes FROM detections ORDER BY lastUsed"):
+            if freed >= excess:
+                break
+            keys.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM detections WHERE key = ?", keys)
+        self._counters["evictions"] += len(keys)
+
+    #(faces, landmarks) of an image, running detection and fitting only on a miss.
+    #img is the decoded image when the caller already has it.
+    def detections(self, image, img=None):
+        image = _readBytes(image) if isinstance(image, str) else image
+        key = self.key(image)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        image_gray = cv2.cvtColor(_decode(image) if img is None else img, cv2.COLOR_BGR2GRAY)
+        faces = self.analyzer.detect(image_gray)
+        if len(faces):
+            landmarks = np.concatenate([np.asarray(points).reshape(1, 68, 2)
+                                        for points in self.analyzer.fit(image_gray, faces)])
+        else:
+            faces, landmarks = np.zeros((0, 4)), np.zeros((0, 68, 2))
+        self.put(key, faces, landmarks)
+        return np.asarray(faces, dtype=np.int32).reshape(-1, 4), np.asarray(landmarks, dtype=np.float32)
+
+    #image (path, encoded bytes or BGR array) -> goldenFace for the first face,
+    #like goldenFace(image) but detection and fitting come from the cache when possible
+    def analyze(self, image):
+        from . import goldenFace
+
+        image = _readBytes(image) if isinstance(image, str) else image
+        img = _decode(image)
+        faces, landmarks = self.detections(image, img)
+        return self._build(goldenFace, img, faces, landmarks)
+
+    #Compact result (goldenFace.toDict) without decoding the image on a hit,
+    #for re-scoring archives. "faceBorders" is None when no face was found.
+    def result(self, image):
+        return self.results([image])[0]
+
+    #result() of many images; the metrics of all of them are computed in one
+    #vectorized batchMath pass. An image that fails (it can not be read, or goldenMath
+    #raises for its face) gets {"faceBorders": ..., "error": ..., "errorType": ...}
+    #like analyzeBatch results; the other images are not affected.
+    def results(self, images):
+        results = [{"faceBorders": None} for _ in images]
+        detections = {}
+        for i, image in enumerate(images):
+            try:
+                faces, landmarks = self.detections(image)
+            except Exception as e:
+                results[i] = _error(None, e)
+                continue
+            if len(faces):
+                detections[i] = (faces, landmarks)
+        if not detections:
+            return results
+
+        found = list(detections)
+        faceBorders = np.array([detections[i][0][0] for i in found])
+        # landmarks are truncated to int like goldenFace.landmarks
+        points = landmark.facialPointArrays(np.array([detections[i][1][0] for i in found]).astype(int))
+        metrics = batchMath.calculateMetrics(faceBorders, points)
+
+        for row, i in enumerate(found):
+            (x,y,w,h) = (int(v) for v in faceBorders[row])
+            values = [metrics[name][row] for name in ("unitSize",) + _metricKeys]
+            try:
+                if not np.all(np.isfinite(values)):
+                    # goldenMath raises where batchMath gives inf/nan, the scalar path keeps that behaviour
+                    from . import goldenFace
+                    results[i] = self._build(goldenFace, _noImage, *detections[i]).toDict()
+                    continue
+                facePoints = landmark.pointsToDict(points[row])
+                result = {"faceBorders": [x, y, w, h], "facePoints": facePoints}
+                result.update((name, float(metrics[name][row])) for name in _metricKeys)
+                result["vector"] = goldenMath.face2Vec((x, y, w, h), facePoints, float(metrics["unitSize"][row]))
+                results[i] = result
+            except Exception as e:
+                results[i] = _error([x, y, w, h], e)
+        return results
+
+    def _build(self, goldenFace, img, faces, landmarks):
+        if not len(faces):
+            face = goldenFace(img, analyzer=self.analyzer)
+            face.detect(faces=())
+            return face
+        # landmarks come back as fit returns them: (1, 68, 2) per face
+        return goldenFace.fromDetection(img, faces[0], landmarks[0].reshape(1, 68, 2),
+                                        analyzer=self.analyzer, faces=faces)
+
+
+def _error(faceBorders, exception):
+    return {"faceBorders": faceBorders, "error": str(exception), "errorType": type(exception).__name__}
+
+def _decode(image):
+    if isinstance(image, np.ndarray):
+        return image
+    img = cv2.imdecode(np.frombuffer(bytes(image), dtype=np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("Could not load image. Please check the path or input array.")
+    return img
@@ -6,6 +6,7 @@
 # Mail        : umit@aksoylu.space
 # Github      : https://github.com/Aksoylu/GoldenFace
 import json
+import math
 
 def kokal(x):
     if x>0:
@@ -27,24 +28,126 @@ def euclideanDistance(A,B):
         distance = kokal(total)
         return distance
 
-def noktasalCarpim(vector1,vector2):
-    if len(vector1) != len(vector2):
-        return -1
+# Face vectors are compared on the second component of every element (as the original
+# noktasalCarpim/vectorBoyut loops did). The kernels below take one (29, 2) vector or an
+# (N, 29, 2) stack and optionally reuse norms computed earlier with vectorNorms.
+# Two plain face2Vec lists are faster to compare in Python than to convert, so that
+# case keeps the original loop (and its exact results).
+# numpy is imported inside the kernels, so loading/saving JSON vectors does not need it.
+def _components(vectors, dtype=None):
+    import numpy as np
+    return np.asarray(vectors, dtype=dtype or np.float64)[..., 1]
+
+def _isList(vector):
+    return isinstance(vector, list) and len(vector) > 0 and isinstance(vector[0][0], (int, float))
 
+def _listDot(vector1,vector2):
     toplam = 0
     for i in range(len(vector1)):
         toplam = toplam + vector1[i][1] * vector2[i][1]
     return toplam
 
+def noktasalCarpim(vector1,vector2):
+    if len(vector1) != len(vector2):
+        return -1
+    if _isList(vector1) and _isList(vector2):
+        return _listDot(vector1, vector2)
+    return float(_components(vector1) @ _components(vector2))
+
 def vectorBoyut(vector):
-    toplam = 0
-    for i in range(len(vector)):
-        toplam = toplam + (vector[i][1] * vector[i][1])
+    if _isList(vector):
+        return _listDot(vector, vector) ** (1/2)
+    a = _components(vector)
+    return math.sqrt(a @ a)
+
+#public
+#Norm of one vector, or one norm per vector of a stack
+def vectorNorms(vectors):
+    import numpy as np
+    return np.linalg.norm(_components(vectors), axis=-1)
 
-    return toplam ** (1/2)
+#public
+#Stack -> (N, 29) rows of unit length, ready for plain dot products. Zero vectors stay zero.
+def normalizeVectors(vectors, dtype=None):
+    import numpy as np
+    components = _components(vectors, dtype).reshape(-1, 29)
+    norms = np.linalg.norm(components, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return components / norms
 
-def cosineSimilarity(vector1,vector2):
-    return noktasalCarpim(vector1,vector2)  / ( vectorBoyut(vector1) * vectorBoyut(vector2) )
+#public
+#one vs one
+def cosineSimilarity(vector1,vector2,norm1=None,norm2=None):
+    if _isList(vector1) and _isList(vector2):
+        if norm1 is None:
+            norm1 = _listDot(vector1, vector1) ** (1/2)
+        if norm2 is None:
+            norm2 = _listDot(vector2, vector2) ** (1/2)
+        return _listDot(vector1, vector2) / (norm1 * norm2)
+    a = _components(vector1)
+    b = _components(vector2)
+    if norm1 is None:
+        norm1 = math.sqrt(a @ a)
+    if norm2 is None:
+        norm2 = math.sqrt(b @ b)
+    return float(a @ b) / (float(norm1) * float(norm2))
+
+#public
+#one vs many: (29, 2) against (N, 29, 2) -> (N,)
+def cosineSimilarities(vector,vectors,norm=None,norms=None):
+    import numpy as np
+    a = _components(vector)
+    b = _components(vectors).reshape(-1, 29)
+    if norm is None:
+        norm = np.linalg.norm(a)
+    if norms is None:
+        norms = np.linalg.norm(b, axis=1)
+    return (b @ a) / (norms * norm)
+
+#public
+#many vs many: (N, 29, 2) against (M, 29, 2) -> (N, M)
+def cosineSimilarityMatrix(vectors1,vectors2,norms1=None,norms2=None):
+    import numpy as np
+    a = _components(vectors1).reshape(-1, 29)
+    b = _components(vectors2).reshape(-1, 29)
+    if norms1 is None:
+        norms1 = np.linalg.norm(a, axis=1)
+    if norms2 is None:
+        norms2 = np.linalg.norm(b, axis=1)
+    return (a @ b.T) / np.outer(norms1, norms2)
+
+#public
+#Euclidean distance between two face vectors (second components)
+def vectorDistance(vector1,vector2):
+    import numpy as np
+    return float(np.linalg.norm(_components(vector1) - _components(vector2)))
+
+#public
+#one vs many -> (N,)
+def vectorDistances(vector,vectors):
+    import numpy as np
+    return np.linalg.norm(_components(vectors).reshape(-1, 29) - _components(vector), axis=1)
+
+#public
+#many vs many -> (N, M). Uses |a|^2 + |b|^2 - 2ab, so norms can be passed in as well.
+def vectorDistanceMatrix(vectors1,vectors2,norms1=None,norms2=None):
+    import numpy as np
+    a = _components(vectors1).reshape(-1, 29)
+    b = _components(vectors2).reshape(-1, 29)
+    if norms1 is None:
+        norms1 = np.linalg.norm(a, axis=1)
+    if norms2 is None:
+        norms2 = np.linalg.norm(b, axis=1)
+    squared = norms1[:, None] ** 2 + norms2[None, :] ** 2 - 2 * (a @ b.T)
+    return np.sqrt(np.maximum(squared, 0))
+
+#public
+#Point distances for equal length coordinate rows: (N, D) against (M, D) -> (N, M)
+def euclideanDistances(A,B):
+    import numpy as np
+    A = np.asarray(A, dtype=np.float64).reshape(len(A), -1)
+    B = np.asarray(B, dtype=np.float64).reshape(len(B), -1)
+    return np.sqrt(((A[:, None, :] - B[None, :, :]) ** 2).sum(axis=2))
 
 def calculateVector(A,B):
 
@@ -0,0 +1,171 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import os
+import numpy as np
+from . import functions
+
+
+#public
+#Persistent face vector gallery.
+#A directory holding a memory-mapped float32 matrix (vectors.f32, one pre-normalised row
+#per face), the row ids (ids.txt, one per line) and deleted rows (deleted.txt).
+#top_k scores the query against the whole matrix in fixed size chunks, so memory use
+#does not grow with the gallery; similarities equal goldenMath.vectorFaceSimilarity.
+class FaceGallery:
+
+    dim = 29
+
+    def __init__(self, path, chunkRows=65536):
+        self.path = path
+        self.chunkRows = chunkRows
+        os.makedirs(path, exist_ok=True)
+
+        self._vectorsPath = os.path.join(path, "vectors.f32")
+        self._idsPath = os.path.join(path, "ids.txt")
+        self._deletedPath = os.path.join(path, "deleted.txt")
+
+        self.ids = []
+        if os.path.exists(self._idsPath):
+            with open(self._idsPath) as idsFile:
+                self.ids = idsFile.read().splitlines(keepends=True)
+        self._recover()
+
+        self._deleted = np.zeros(len(self.ids), dtype=bool)
+        if os.path.exists(self._deletedPath):
+            with open(self._deletedPath) as deletedFile:
+                rows = [int(row) for row in deletedFile.read().split()]
+            self._deleted[[row for row in rows if row < len(self.ids)]] = True
+
+        self._rows = {faceId: row for row, faceId in enumerate(self.ids) if not self._deleted[row]}
+        self._map()
+
+    # addMany appends to vectors.f32, then to ids.txt. After a crash in between, the
+    # files are cut back to the rows both have complete (a partial id line is dropped),
+    # so later rows keep their vectors.
+    def _recover(self):
+        lines = self.ids
+        complete = lines if not lines or lines[-1].endswith("\n") else lines[:-1]
+        self.ids = [faceId.rstrip("\n") for faceId in complete]
+
+        rowBytes = self.dim * np.dtype(np.float32).itemsize
+        size = os.path.getsize(self._vectorsPath) if os.path.exists(self._vectorsPath) else 0
+        rows = min(size // rowBytes, len(self.ids))
+        if size != rows * rowBytes:
+            with open(self._vectorsPath, "r+b") as vectorsFile:
+                vectorsFile.truncate(rows * rowBytes)
+        if len(lines) != rows:
+            self.ids = self.ids[:rows]
+            with open(self._idsPath + ".tmp", "w") as idsFile:
+                idsFile.write("".join(faceId + "\n" for faceId in self.ids))
+            os.replace(self._idsPath + ".tmp", self._idsPath)
+
+    def _map(self):
+        if self.ids:
+            self.matrix = np.memmap(self._vectorsPath, dtype=np.float32, mode="r", shape=(len(self.ids), self.dim))
+        else:
+            self.matrix = np.zeros((0, self.dim), dtype=np.float32)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, faceId):
+        return str(faceId) in self._rows
+
+    def add(self, faceId, vector):
+        self.addMany([faceId], [vector])
+
+    #ids: iterable of ids, vectors: face2Vec outputs (or an (N, 29, 2) array)
+    def addMany(self, ids, vectors):
+        ids = [str(faceId) for faceId in ids]
+        if not ids:
+            if len(vectors):
+                raise ValueError("ids and vectors must have the same length")
+            return
+        features = functions.normalizeVectors(vectors, np.float32)
+        if len(ids) != len(features):
+            raise ValueError("ids and vectors must have the same length")
+        if any("\n" in faceId for faceId in ids):
+            raise ValueError("Face ids can not contain new lines")
+
+        # An id given twice keeps only its last vector
+        last = {faceId: i for i, faceId in enumerate(ids)}
+        if len(last) < len(ids):
+            keep = sorted(last.values())
+            ids = [ids[i] for i in keep]
+            features = features[keep]
+
+        # Re-adding an id replaces the stored vector
+        for faceId in ids:
+            if faceId in self._rows:
+                self.delete(faceId)
+
+        with open(self._vectorsPath, "ab") as vectorsFile:
+            vectorsFile.write(features.tobytes())
+        with open(self._idsPath, "a") as idsFile:
+            idsFile.write("".join(faceId + "\n" for faceId in ids))
+
+        start = len(self.ids)
+        self.ids.extend(ids)
+        for row, faceId in enumerate(ids, start):
+            self._rows[faceId] = row
+        self._deleted = np.concatenate([self._deleted, np.zeros(len(ids), dtype=bool)])
+        self._map()
+
+    def delete(self, faceId):
+        row = self._rows.pop(str(faceId))
+        self._deleted[row] = True
+        with open(self._deletedPath, "a") as deletedFile:
+            deletedFile.write(f"{row}\n")
+
+    #Best k matches for a face vector: [(id, similarity), ...] best first
+    def top_k(self, query, k=5):
+        if k <= 0:
+            return []
+        query = functions.normalizeVectors(query, np.float32)[0]
+        bestScores = np.empty(0, dtype=np.float32)
+        bestRows = np.empty(0, dtype=np.int64)
+
+        for start in range(0, len(self.ids), self.chunkRows):
+            scores = self.matrix[start:start + self.chunkRows] @ query
+            scores[self._deleted[start:start + len(scores)]] = -np.inf
+
+            if len(scores) > k:
+                keep = np.argpartition(scores, -k)[-k:]
+            else:
+                keep = np.arange(len(scores))
+            bestScores = np.concatenate([bestScores, scores[keep]])
+            bestRows = np.concatenate([bestRows, keep + start])
+
+            if len(bestScores) > k:
+                keep = np.argpartition(bestScores, -k)[-k:]
+                bestScores, bestRows = bestScores[keep], bestRows[keep]
+
+        order = np.argsort(-bestScores, kind="stable")
+        return [(self.ids[row], float(score)) for row, score in zip(bestRows[order], bestScores[order])
+                if np.isfinite(score)]
+
+    #Rewrite the files without deleted rows
+    def compact(self):
+        keep = np.flatnonzero(~self._deleted)
+        features = np.array(self.matrix[keep]) if len(keep) else np.zeros((0, self.dim), dtype=np.float32)
+        ids = [self.ids[row] for row in keep]
+        self.matrix = None
+
+        with open(self._vectorsPath + ".tmp", "wb") as vectorsFile:
+            vectorsFile.write(features.tobytes())
+        with open(self._idsPath + ".tmp", "w") as idsFile:
+            idsFile.write("".join(faceId + "\n" for faceId in ids))
+        os.replace(self._vectorsPath + ".tmp", self._vectorsPath)
+        os.replace(self._idsPath + ".tmp", self._idsPath)
+        if os.path.exists(self._deletedPath):
+            os.remove(self._deletedPath)
+
+        self.ids = ids
+        self._deleted = np.zeros(len(ids), dtype=bool)
+        self._rows = {faceId: row for row, faceId in enumerate(ids)}
+        self._map()
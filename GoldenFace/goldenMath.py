@@ -7,6 +7,8 @@
 # Github      : https://github.com/Aksoylu/GoldenFace
 import cv2
 from . import functions as functions
+from . import reference
+from . import overlay
 
 
 red = (255, 255, 0)
@@ -29,12 +31,16 @@ def calculateUnit(facePoints):
     unitSize = left_eye_distance / pieceCount
     return unitSize
 
-def scaleDistance(distance):
-    return distance/unitSize
+#unit defaults to the module level unitSize for backwards compatibility;
+#pass it explicitly to keep concurrent analyses independent
+def scaleDistance(distance, unit=None):
+    if unit is None:
+        unit = unitSize
+    return distance/unit
 
 #public
 #Calculate Trichon-Glabella-Subnazale-Menton
-def calculateTGSM(faceBorders,facePoints):
+def calculateTGSM(faceBorders,facePoints,unitSize=None):
     (x,y,w,h) = faceBorders
 
     #Trichion
@@ -56,15 +62,15 @@ def calculateTGSM(faceBorders,facePoints):
 
     #Trichion-Glabella distance
     TGdistance = functions.euclideanDistance( (x, trichionY) , (x,  Glabella_Y))
-    TGdistance = scaleDistance(TGdistance)
+    TGdistance = scaleDistance(TGdistance, unitSize)
 
     #Glabella-Subnazale distance
     GSdistance = functions.euclideanDistance( (x, Glabella_Y) , (x,  Subnazale_Y))
-    GSdistance = scaleDistance(GSdistance)
+    GSdistance = scaleDistance(GSdistance, unitSize)
 
     #Subnazale-menton distance
     SMdistance = functions.euclideanDistance( (x, Subnazale_Y) , (x,  Menton_y))
-    SMdistance = scaleDistance(SMdistance)
+    SMdistance = scaleDistance(SMdistance, unitSize)
 
     avg  = (TGdistance + GSdistance + SMdistance) /3
 
@@ -99,20 +105,20 @@ def drawTGSM(img,faceBorders,facePoints,color):
 
 #public
 #Calculate Vertical Face Map Ratio
-def calculateVFM(faceBorders,facePoints):
+def calculateVFM(faceBorders,facePoints,unitSize=None):
     (x,y,w,h) = faceBorders
     #seperator 1
-    s1 = scaleDistance(abs(facePoints["face_left"][0] - facePoints["left_eye_left"][0]))
+    s1 = scaleDistance(abs(facePoints["face_left"][0] - facePoints["left_eye_left"][0]), unitSize)
     #seperator 2
-    s2 = scaleDistance(abs(facePoints["left_eye_left"][0] - facePoints["left_eye_right"][0]))
+    s2 = scaleDistance(abs(facePoints["left_eye_left"][0] - facePoints["left_eye_right"][0]), unitSize)
     #seperator 3
-    s3 = scaleDistance(abs(facePoints["left_eye_right"][0] - facePoints["right_eye_left"][0]))
+    s3 = scaleDistance(abs(facePoints["left_eye_right"][0] - facePoints["right_eye_left"][0]), unitSize)
     #seperator 4
-    s4 = scaleDistance(abs(facePoints["right_eye_left"][0] - facePoints["right_eye_right"][0]))
+    s4 = scaleDistance(abs(facePoints["right_eye_left"][0] - facePoints["right_eye_right"][0]), unitSize)
     #seperator 5
-    s4 = scaleDistance(abs(facePoints["right_eye_right"][0] - facePoints["face_right"][0]))
+    s4 = scaleDistance(abs(facePoints["right_eye_right"][0] - facePoints["face_right"][0]), unitSize)
 
-    face_width = scaleDistance(abs(facePoints["face_left"][0] - facePoints["face_right"][0]))
+    face_width = scaleDistance(abs(facePoints["face_left"][0] - facePoints["face_right"][0]), unitSize)
     avg = face_width /5
 
     deflectionPercent = (abs(s1 -avg ) + abs(s2 -avg ) + abs(s3 -avg ) + abs(s4 -avg ) ) /face_width * 100
@@ -141,15 +147,15 @@ def drawVFM(img,faceBorders,facePoints,color):
 
 #public
 #Calculate Trichon-Zygoma-Menton Ratio
-def calculateTZM(faceBorders,facePoints):
+def calculateTZM(faceBorders,facePoints,unitSize=None):
     (x,y,w,h) = faceBorders
 
 
     #Zygoma distance
-    Zdistance =  scaleDistance(abs(facePoints["face_left"][0] -  facePoints["face_right"][0]))
+    Zdistance =  scaleDistance(abs(facePoints["face_left"][0] -  facePoints["face_right"][0]), unitSize)
 
     #Trichion-Menton distance
-    TMdistance = scaleDistance(abs(y -  facePoints["chin_down"][1]))
+    TMdistance = scaleDistance(abs(y -  facePoints["chin_down"][1]), unitSize)
     deflectionPercent = abs(1.618 - TMdistance/Zdistance) / 1.618 * 100
 
     return deflectionPercent
@@ -176,13 +182,13 @@ def drawTZM(img,faceBorders,facePoints,color):
 
 #public
 #Calculate Trichon-Subnazale-Menton Ratio
-def calculateTSM(faceBorders,facePoints):
+def calculateTSM(faceBorders,facePoints,unitSize=None):
     (x,y,w,h) = faceBorders
     #Trichion-Subnazale
 
-    TSdistance = scaleDistance( abs(y - facePoints["nose_bottom"][1]) )
+    TSdistance = scaleDistance( abs(y - facePoints["nose_bottom"][1]), unitSize )
 
-    SMdistance = scaleDistance( abs(facePoints["nose_bottom"][1] - facePoints["chin_down"][1]) )
+    SMdistance = scaleDistance( abs(facePoints["nose_bottom"][1] - facePoints["chin_down"][1]), unitSize )
 
     deflectionPercent = abs( 1.618 - TSdistance / SMdistance) /1.618 * 100
     return deflectionPercent
@@ -229,76 +235,22 @@ def drawLC(img,faceBorders,facePoints,color):
     return img
 
 #public
+#facePoints: facial point dict or (16, 2) point array; drawn from the compiled "mask" overlay
 def drawMask(img,faceBorders,facePoints,color):
+    return overlay.draw("mask", img, facePoints, color)
 
-    red = color
-    cv2.line(img, (int(facePoints["face_left"][0]), int(facePoints["face_left"][1])), (int(facePoints["left_eye_left"][0]), int(facePoints["left_eye_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["face_right"][0]), int(facePoints["face_right"][1])), (int(facePoints["right_eye_right"][0]), int(facePoints["right_eye_right"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["left_eye_left"][0]), int(facePoints["left_eye_left"][1])), (int(facePoints["mouth_left"][0]), int(facePoints["mouth_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["right_eye_right"][0]), int(facePoints["right_eye_right"][1])), (int(facePoints["mouth_right"][0]), int(facePoints["mouth_right"][1])), red, 2) 
-
-
-    cv2.line(img, (int(facePoints["face_left"][0]), int(facePoints["face_left"][1])), (int(facePoints["mouth_left"][0]), int(facePoints["mouth_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["face_right"][0]), int(facePoints["face_right"][1])), (int(facePoints["mouth_right"][0]), int(facePoints["mouth_right"][1])), red, 2) 
-
-
-    cv2.line(img, (int(facePoints["chin_down"][0]), int(facePoints["chin_down"][1])), (int(facePoints["mouth_left"][0]), int(facePoints["mouth_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["chin_down"][0]), int(facePoints["chin_down"][1])), (int(facePoints["mouth_right"][0]), int(facePoints["mouth_right"][1])), red, 2) 
-
-
-    cv2.line(img, (int(facePoints["nose_bottom"][0]), int(facePoints["nose_bottom"][1])), (int(facePoints["mouth_left"][0]), int(facePoints["mouth_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["nose_bottom"][0]), int(facePoints["nose_bottom"][1])), (int(facePoints["mouth_right"][0]), int(facePoints["mouth_right"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["left_eye_right"][0]), int(facePoints["left_eye_right"][1])), (int(facePoints["mouth_left"][0]), int(facePoints["mouth_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["right_eye_left"][0]), int(facePoints["right_eye_left"][1])), (int(facePoints["mouth_right"][0]), int(facePoints["mouth_right"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["left_eye_right"][0]), int(facePoints["left_eye_right"][1])), (int(facePoints["nose_bottom"][0]), int(facePoints["nose_bottom"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["right_eye_left"][0]), int(facePoints["right_eye_left"][1])), (int(facePoints["nose_bottom"][0]), int(facePoints["nose_bottom"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["face_left"][0]), int(facePoints["face_left"][1])), (int(facePoints["left_eyebrow_left"][0]), int(facePoints["left_eyebrow_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["face_right"][0]), int(facePoints["face_right"][1])), (int(facePoints["right_eyebrow_right"][0]), int(facePoints["right_eyebrow_right"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["left_eyebrow_left"][0]), int(facePoints["left_eyebrow_left"][1])), (int(facePoints["left_eye_left"][0]), int(facePoints["left_eye_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["right_eyebrow_right"][0]), int(facePoints["right_eyebrow_right"][1])), (int(facePoints["right_eye_right"][0]), int(facePoints["right_eye_right"][1])), red, 2) 
-
-
-    cv2.line(img, (int(facePoints["left_eye_right"][0]), int(facePoints["left_eye_right"][1])), (int(facePoints["left_eyebrow_right"][0]), int(facePoints["left_eyebrow_right"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["right_eye_left"][0]), int(facePoints["right_eye_left"][1])), (int(facePoints["right_eyebrow_left"][0]), int(facePoints["right_eyebrow_left"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["left_eyebrow_right"][0]), int(facePoints["left_eyebrow_right"][1])), (int(facePoints["left_eyebrow_left"][0]), int(facePoints["left_eyebrow_left"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["right_eyebrow_left"][0]), int(facePoints["right_eyebrow_left"][1])), (int(facePoints["right_eyebrow_right"][0]), int(facePoints["right_eyebrow_right"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["face_left"][0]), int(facePoints["face_left"][1])), (int(facePoints["face_left"][0]), int(facePoints["chin_down"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["face_right"][0]), int(facePoints["face_right"][1])), (int(facePoints["face_right"][0]), int(facePoints["chin_down"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["face_left"][0]), int(facePoints["chin_down"][1])), (int(facePoints["face_right"][0]), int(facePoints["chin_down"][1])), red, 2) 
-
-
-    cv2.line(img, (int(facePoints["mouth_left"][0]), int(facePoints["mouth_left"][1])), (int(facePoints["face_left"][0]), int(facePoints["chin_down"][1])), red, 2) 
-    cv2.line(img, (int(facePoints["mouth_right"][0]), int(facePoints["mouth_right"][1])), (int(facePoints["face_right"][0]), int(facePoints["chin_down"][1])), red, 2) 
-
-
-
-    cv2.line(img, (int(facePoints["left_eyebrow_right"][0]), int(facePoints["left_eyebrow_right"][1])), (int(facePoints["right_eyebrow_left"][0]), int(facePoints["right_eyebrow_left"][1])), red, 2) 
-
-    cv2.line(img, (int(facePoints["left_eye_right"][0]), int(facePoints["left_eye_right"][1])), (int(facePoints["right_eye_left"][0]), int(facePoints["right_eye_left"][1])), red, 2) 
-
-
-    return img
-
-def face2Vec(faceBorders,facePoints):
+def face2Vec(faceBorders,facePoints,unitSize=None):
 
     (x,y,w,h) = faceBorders
-    # 1: Scale Face Matrix
-    newScaledPoints = facePoints.copy()
+    # 1: Scale Face Matrix (on a copy, the caller's points stay untouched)
+    newScaledPoints = {key: list(value) for key, value in facePoints.items()}
     for i in newScaledPoints:
 
         Xi = facePoints[i][0]
         Yi = facePoints[i][1]
 
-        Xa = scaleDistance(Xi- x)
-        Ya = scaleDistance(Yi -y)
+        Xa = scaleDistance(Xi- x, unitSize)
+        Ya = scaleDistance(Yi -y, unitSize)
 
         Xa =  Xa / ((x+w - x) / 1000)
         Ya =  Ya / ((y+h - y) / 1000)
@@ -306,6 +258,7 @@ def face2Vec(faceBorders,facePoints):
         newScaledPoints[i][0] = int(Xa)
         newScaledPoints[i][1] = int(Ya)
 
+    facePoints = newScaledPoints
     Vector3 = []
 
 
@@ -372,22 +325,15 @@ def vectorFaceSimilarity(vectorFace1,vectorFace2):
 
 #public
 def goldenFace():
-    return functions.loadFaceVec("goldenFace.json")
+    return reference.defaultRegistry().vector("golden")
 
 #public
 
 def drawFacialPoints(img,facePoints,color):
-
-    for point in facePoints:
-        coord = (int(facePoints[point][0]), int(facePoints[point][1]))
-        cv2.circle(img,coord,1,color,5)
-    return img
+    return overlay.draw("facialPoints", img, facePoints, color)
 
 #public
 def drawLandmarks(img,landmarks,color):
-
     for landmarkArray in landmarks[0]:
-        for landmark in landmarkArray:
-            coord = (int(landmark[0]), int(landmark[1]))
-            cv2.circle(img,coord,1,color,5)
-    return img
\ No newline at end of file
+        overlay.draw("landmarks", img, landmarkArray, color)
+    return img
@@ -0,0 +1,255 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import hashlib
+import json
+import os
+import threading
+import time
+import warnings
+from contextlib import ExitStack
+import cv2
+import numpy as np
+from importlib import resources
+
+#public
+#Landmark model to load ($GOLDENFACE_LANDMARK_MODEL), None uses the landmark.yaml shipped with the package
+landmarkModelFile = os.environ.get("GOLDENFACE_LANDMARK_MODEL")
+
+#public
+#The text landmark.yaml takes seconds to parse. On first load it is rewritten once as a
+#base64 FileStorage (same nodes, binary matrix payloads) that later processes load instead.
+#The cache goes to $GOLDENFACE_CACHE_DIR when set, else next to the model when that
+#directory is writable, else to ~/.cache/goldenface. GOLDENFACE_MODEL_CACHE=0 turns it off.
+useModelCache = os.environ.get("GOLDENFACE_MODEL_CACHE", "1") != "0"
+
+_cacheVersion = 1
+
+#How the last landmark model of the process was loaded: "hit", "built", "off" or "failed"
+lastCacheStatus = None
+
+
+#public
+def createLandmarkDetector():
+    return loadLandmarkDetector()[0]
+
+#public
+#New FacemarkLBF with the landmark model loaded, and how this load used the cache
+def loadLandmarkDetector():
+    global lastCacheStatus
+    detector = cv2.face.createFacemarkLBF()
+    if landmarkModelFile is not None:
+        path, status = landmarkModelPath(landmarkModelFile)
+        detector.loadModel(path)
+    else:
+        with resources.as_file(resources.files(__package__) / "landmark.yaml") as filepath:
+            path, status = landmarkModelPath(str(filepath))
+            detector.loadModel(path)
+    lastCacheStatus = status
+    return detector, status
+
+#public
+def createFaceDetector():
+    return cv2.CascadeClassifier(cv2.data.haarcascades+'haarcascade_frontalface_default.xml')
+
+
+#public
+#Identity of the models results depend on: OpenCV version, cascade file and the
+#landmark model file (path, size, mtime). Persistent caches key their entries on it.
+def modelVersion():
+    cascade = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+    if landmarkModelFile is not None:
+        landmark = _fileInfo(landmarkModelFile)
+    else:
+        with resources.as_file(resources.files(__package__) / "landmark.yaml") as filepath:
+            landmark = _fileInfo(str(filepath))
+    return f"opencv={cv2.__version__};cascade={_fileInfo(cascade)};landmark={landmark}"
+
+def _fileInfo(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{os.path.realpath(path)}:missing"
+    return f"{os.path.realpath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+#public
+#Path to load for a landmark model (its cache when possible) and the cache status
+def landmarkModelPath(source):
+    if not useModelCache:
+        return source, "off"
+
+    cachePath = _cachePath(source)
+    if _cacheValid(source, cachePath):
+        return cachePath, "hit"
+    try:
+        _buildCache(source, cachePath)
+        return cachePath, "built"
+    except (OSError, ValueError, cv2.error) as e:
+        warnings.warn(f"Landmark model cache not used: {e}", RuntimeWarning)
+        return source, "failed"
+
+
+def _cacheDirectories(source):
+    if os.environ.get("GOLDENFACE_CACHE_DIR"):
+        return [os.environ["GOLDENFACE_CACHE_DIR"]]
+    directories = [os.path.dirname(os.path.abspath(source))]
+    cacheHome = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    directories.append(os.path.join(cacheHome, "goldenface"))
+    return directories
+
+def _cacheName(source):
+    # one cache per model file, so a shared cache directory can hold several
+    key = hashlib.sha1(os.path.realpath(source).encode()).hexdigest()[:12]
+    return f"{os.path.splitext(os.path.basename(source))[0]}.{key}.b64.yml"
+
+def _cachePath(source):
+    name = _cacheName(source)
+    directories = _cacheDirectories(source)
+    for directory in directories:
+        if os.path.exists(os.path.join(directory, name)):
+            return os.path.join(directory, name)
+    for directory in directories:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(directory, os.W_OK):
+            return os.path.join(directory, name)
+    return os.path.join(directories[-1], name)
+
+def _sourceInfo(source):
+    stat = os.stat(source)
+    return {"version": _cacheVersion, "source": os.path.realpath(source), "size": stat.st_size,
+            "mtime": stat.st_mtime_ns, "opencv": cv2.__version__}
+
+def _checksum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as cacheFile:
+        for block in iter(lambda: cacheFile.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+# cache path -> (model info, cache file size and mtime) of caches whose checksum was
+# verified by this process; unchanged files are not hashed again
+_verifiedCaches = {}
+_verifiedLock = threading.Lock()
+
+def _cacheValid(source, cachePath):
+    try:
+        cacheStat = os.stat(cachePath)
+        identity = (_sourceInfo(source), cacheStat.st_size, cacheStat.st_mtime_ns)
+        with _verifiedLock:
+            if _verifiedCaches.get(cachePath) == identity:
+                return True
+        with open(cachePath + ".json") as metaFile:
+            meta = json.load(metaFile)
+        expected = dict(identity[0], sha256=meta.get("sha256"))
+        if meta != expected or _checksum(cachePath) != meta["sha256"]:
+            return False
+    except (OSError, ValueError, KeyError):
+        return False
+    with _verifiedLock:
+        _verifiedCaches[cachePath] = identity
+    return True
+
+def _readNode(node):
+    if node.isInt():
+        return int(node.real())
+    if node.isReal():
+        return node.real()
+    if node.isString():
+        return node.string()
+    if node.isSeq():
+        return [_readNode(node.at(i)) for i in range(node.size())]
+    if node.isMap():
+        matrix = node.mat()
+        if matrix is not None:
+            return matrix
+    raise ValueError(f"unsupported node in landmark model: {node.name()}")
+
+def _writeNode(storage, name, value):
+    if isinstance(value, list):
+        storage.startWriteStruct(name, cv2.FileNode_SEQ | cv2.FileNode_FLOW)
+        for element in value:
+            _writeNode(storage, "", element)
+        storage.endWriteStruct()
+    else:
+        storage.write(name, value)
+
+def _sameValue(a, b):
+    if isinstance(a, np.ndarray):
+        return isinstance(b, np.ndarray) and a.dtype == b.dtype and np.array_equal(a, b)
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(_sameValue(x, y) for x, y in zip(a, b))
+    return type(a) == type(b) and a == b
+
+def _readStorage(path):
+    storage = cv2.FileStorage(path, cv2.FILE_STORAGE_READ)
+    if not storage.isOpened():
+        raise ValueError(f"can not read {path}")
+    root = storage.root()
+    nodes = [(name, _readNode(root.getNode(name))) for name in root.keys()]
+    storage.release()
+    return nodes
+
+def _buildCache(source, cachePath):
+    nodes = _readStorage(source)
+
+    temporary = f"{cachePath}.{os.getpid()}.tmp.yml"
+    try:
+        storage = cv2.FileStorage(temporary, cv2.FILE_STORAGE_WRITE | cv2.FILE_STORAGE_BASE64)
+        for name, value in nodes:
+            _writeNode(storage, name, value)
+        storage.release()
+
+        # only keep the cache if it reads back to exactly the same model
+        written = _readStorage(temporary)
+        if len(written) != len(nodes) or not all(
+                name == otherName and _sameValue(value, otherValue)
+                for (name, value), (otherName, otherValue) in zip(nodes, written)):
+            raise ValueError("landmark model cache does not match the model")
+
+        meta = dict(_sourceInfo(source), sha256=_checksum(temporary))
+        os.replace(temporary, cachePath)
+        with open(cachePath + ".json.tmp", "w") as metaFile:
+            json.dump(meta, metaFile)
+        os.replace(cachePath + ".json.tmp", cachePath + ".json")
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+#public
+#Load the face detector and landmark model of an analyzer into its detector pool, so the
+#first image does not pay for it on any thread. sets > 1 loads that many detector sets
+#(at most the pool size), e.g. one per StreamPipeline worker. Returns the time each step
+#of the first set took and the total (seconds). "landmarkCache" is how this call loaded
+#the first set's landmark model, "loaded" when that set had it loaded already.
+def warmup(analyzer=None, sets=1):
+    if analyzer is None:
+        from .analyzer import defaultAnalyzer
+        analyzer = defaultAnalyzer
+
+    timings = {}
+    start = time.perf_counter()
+    with ExitStack() as stack:
+        for i in range(min(sets, analyzer.detectorPool.size)):
+            # held until all are loaded, so every checkout is a different set
+            detectors = stack.enter_context(analyzer.detectors("landmarkDetector"))
+            faceStart = time.perf_counter()
+            # first detection initialises OpenCV's buffers and thread pool
+            detectors.face().detectMultiScale(np.zeros((64, 64), dtype=np.uint8), analyzer.scaleFactor, analyzer.minNeighbors)
+            landmarkStart = time.perf_counter()
+            loaded = detectors.landmarkDetector is not None
+            detectors.landmark()
+            if i == 0:
+                timings["faceDetector"] = landmarkStart - faceStart
+                timings["landmarkDetector"] = time.perf_counter() - landmarkStart
+                timings["landmarkCache"] = "loaded" if loaded else detectors.landmarkStatus
+    timings["total"] = time.perf_counter() - start
+    return timings
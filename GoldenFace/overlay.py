@@ -0,0 +1,246 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import cv2
+import numpy as np
+
+#public
+#Overlay specs. "segments" are (thickness, [(start, end), ...]) groups; an end is a point
+#(landmark index or facial point name) or an (xPoint, yPoint) pair taking x from the first
+#point and y from the second. "points" are drawn as dots (circle radius / thickness).
+#"names" says the points are facial point names (rows of goldenFace.pointArray)
+#instead of the 68 landmark indices.
+specs = {
+    "mask": {
+        "names": True,
+        "segments": [(2, [
+            ("face_left", "left_eye_left"), ("face_right", "right_eye_right"),
+            ("left_eye_left", "mouth_left"), ("right_eye_right", "mouth_right"),
+            ("face_left", "mouth_left"), ("face_right", "mouth_right"),
+            ("chin_down", "mouth_left"), ("chin_down", "mouth_right"),
+            ("nose_bottom", "mouth_left"), ("nose_bottom", "mouth_right"),
+            ("left_eye_right", "mouth_left"), ("right_eye_left", "mouth_right"),
+            ("left_eye_right", "nose_bottom"), ("right_eye_left", "nose_bottom"),
+            ("face_left", "left_eyebrow_left"), ("face_right", "right_eyebrow_right"),
+            ("left_eyebrow_left", "left_eye_left"), ("right_eyebrow_right", "right_eye_right"),
+            ("left_eye_right", "left_eyebrow_right"), ("right_eye_left", "right_eyebrow_left"),
+            ("left_eyebrow_right", "left_eyebrow_left"), ("right_eyebrow_left", "right_eyebrow_right"),
+            ("face_left", ("face_left", "chin_down")), ("face_right", ("face_right", "chin_down")),
+            (("face_left", "chin_down"), ("face_right", "chin_down")),
+            ("mouth_left", ("face_left", "chin_down")), ("mouth_right", ("face_right", "chin_down")),
+            ("left_eyebrow_right", "right_eyebrow_left"),
+            ("left_eye_right", "right_eye_left"),
+        ])],
+    },
+    # border lines of the 68 landmarks
+    "landmark": {
+        "segments": [
+            # cene
+            (3, [(i, i + 1) for i in range(0, 16)]),
+            # kaslar, alt burun, agiz, dudak
+            (4, [(i, i + 1) for i in range(17, 21)] + [(i, i + 1) for i in range(22, 26)]
+                + [(i, i + 1) for i in range(31, 35)]
+                + [(i, i + 1) for i in range(49, 60)] + [(48, 50)]
+                + [(61, 62), (62, 63)]),
+            # burun kemigi
+            (6, [(27, 28), (28, 29), (29, 30)]),
+            # gozler
+            (2, [(i, i + 1) for i in range(36, 41)] + [(36, 41)]
+                + [(i, i + 1) for i in range(42, 47)] + [(46, (42, 46))]),
+        ],
+    },
+    "landmarks": {"points": list(range(68)), "radius": 1, "thickness": 5},
+    "facialPoints": {"names": True, "points": "all", "radius": 1, "thickness": 5},
+}
+
+_axes = np.array([0, 1])
+
+
+#public
+#A spec compiled to index arrays: draw() gathers every line end from a point array
+#with one fancy index per thickness and renders them in one cv2.polylines call.
+#Dots are zero length lines of the thickness that paints the same pixels as cv2.circle
+#(or, when there is none, a precomputed circle footprint set in one assignment).
+class Overlay:
+
+    def __init__(self, spec, names=None):
+        self.names = tuple(names) if names is not None else None
+        rows = {name: row for row, name in enumerate(self.names or ())}
+
+        def point(ref):
+            return rows[ref] if isinstance(ref, str) else int(ref)
+
+        def end(ref):
+            if isinstance(ref, tuple):
+                return [point(ref[0]), point(ref[1])]
+            return [point(ref), point(ref)]
+
+        self.segments = [(thickness, np.array([[end(start), end(stop)] for start, stop in segments], dtype=np.intp))
+                         for thickness, segments in spec.get("segments", ())]
+
+        points = spec.get("points")
+        if points == "all":
+            points = range(len(self.names))
+        self.points = None
+        if points is not None:
+            self.points = np.array([point(ref) for ref in points], dtype=np.intp)
+            self.stamp = _circleStamp(spec.get("radius", 1), spec.get("thickness", 5))
+            self.dotThickness = _dotThickness(self.stamp)
+
+        # how far drawing reaches around the points, for OverlayLayer's dirty box
+        reach = [thickness for thickness, _ in self.segments]
+        if self.points is not None:
+            reach.append(2 * int(np.abs(self.stamp).max()))
+        self.reach = max(reach, default=0)
+
+    #(N, 2) point array (or a facial point dict for named specs) -> (N, 2) int array
+    def pointArray(self, points):
+        if isinstance(points, dict):
+            points = [points[name] for name in self.names]
+        return np.asarray(points).reshape(-1, 2)
+
+    def draw(self, img, points, color):
+        points = self.pointArray(points)
+        for thickness, index in self.segments:
+            lines = points[index, _axes].astype(np.int32)
+            cv2.polylines(img, list(lines), False, color, thickness)
+        if self.points is not None:
+            centers = points[self.points].astype(np.int32)
+            if self.dotThickness is not None:
+                # zero length lines paint the same pixels as the circles, in one call
+                cv2.polylines(img, list(np.stack([centers, centers], axis=1)), False, color, self.dotThickness)
+            else:
+                _stampPoints(img, centers, self.stamp, color)
+        return img
+
+
+_compiled = {}
+
+#public
+#Compiled overlay of one of the specs (compiled on first use)
+def get(name):
+    overlay = _compiled.get(name)
+    if overlay is None:
+        from .landmark import pointNames
+        spec = specs[name]
+        overlay = _compiled[name] = Overlay(spec, pointNames if spec.get("names") else None)
+    return overlay
+
+#public
+#Draw a named overlay (or an Overlay) onto img in place and return img
+def draw(overlay, img, points, color):
+    if isinstance(overlay, str):
+        overlay = get(overlay)
+    return overlay.draw(img, points, color)
+
+
+def _circleStamp(radius, thickness):
+    # pixel offsets cv2.circle paints around an integer center
+    size = radius + thickness + 2
+    canvas = np.zeros((2 * size + 1, 2 * size + 1), dtype=np.uint8)
+    cv2.circle(canvas, (size, size), radius, 255, thickness)
+    dy, dx = np.nonzero(canvas)
+    return np.stack([dx - size, dy - size], axis=1)
+
+def _dotThickness(stamp):
+    # thickness of a zero length line whose footprint is exactly the circle's, if there is one
+    size = int(np.abs(stamp).max()) + 2
+    expected = np.zeros((2 * size + 1, 2 * size + 1), dtype=np.uint8)
+    expected[stamp[:, 1] + size, stamp[:, 0] + size] = 255
+    dot = np.array([[[size, size], [size, size]]], dtype=np.int32)
+    for thickness in range(1, 2 * size):
+        canvas = np.zeros_like(expected)
+        cv2.polylines(canvas, list(dot), False, 255, thickness)
+        if np.array_equal(canvas, expected):
+            return thickness
+    return None
+
+def _stampPoints(img, centers, stamp, color):
+    pixels = (centers[:, None, :] + stamp[None, :, :]).reshape(-1, 2)
+    height, width = img.shape[:2]
+    inside = (pixels[:, 0] >= 0) & (pixels[:, 0] < width) & (pixels[:, 1] >= 0) & (pixels[:, 1] < height)
+    pixels = pixels[inside]
+    if img.ndim == 2:
+        img[pixels[:, 1], pixels[:, 0]] = color[0] if isinstance(color, (tuple, list)) else color
+    else:
+        # like cv2 drawing, missing channels of the color are 0
+        channels = img.shape[2]
+        img[pixels[:, 1], pixels[:, 0]] = (tuple(color) + (0,) * channels)[:channels]
+
+
+#public
+#Reusable transparent layer. Overlays are drawn onto it (BGRA, alpha marks drawn pixels)
+#and composited onto a frame in one step, optionally blended with `alpha`.
+#Only the box around what was drawn is cleared and composited.
+class OverlayLayer:
+
+    def __init__(self, shape=None):
+        self.image = None
+        self._box = None
+        if shape is not None:
+            self.reset(shape)
+
+    #Clear the layer; a new (height, width[, channels]) shape reallocates it
+    def reset(self, shape=None):
+        if shape is not None and (self.image is None or self.image.shape[:2] != tuple(shape[:2])):
+            self.image = np.zeros((shape[0], shape[1], 4), dtype=np.uint8)
+            self._box = None
+        elif self._box is not None:
+            x0, y0, x1, y1 = self._box
+            self.image[y0:y1, x0:x1] = 0
+        self._box = None
+        return self
+
+    def draw(self, overlay, points, color):
+        if isinstance(overlay, str):
+            overlay = get(overlay)
+        points = overlay.pointArray(points)
+        color = tuple(color)[:3] + (255,)
+        overlay.draw(self.image, points, color)
+        self._grow(points, overlay.reach)
+        return self
+
+    def _grow(self, points, reach):
+        height, width = self.image.shape[:2]
+        low = np.floor(points.min(axis=0)).astype(int) - reach - 1
+        high = np.ceil(points.max(axis=0)).astype(int) + reach + 2
+        box = (max(0, low[0]), max(0, low[1]), min(width, high[0]), min(height, high[1]))
+        if self._box is not None:
+            box = (min(box[0], self._box[0]), min(box[1], self._box[1]),
+                   max(box[2], self._box[2]), max(box[3], self._box[3]))
+        self._box = box
+
+    def composite(self, img, alpha=1.0):
+        if self._box is None:
+            return img
+        x0, y0, x1, y1 = self._box
+        layer = self.image[y0:y1, x0:x1]
+        target = img[y0:y1, x0:x1]
+        drawn = layer[..., 3].copy()
+        colors = cv2.cvtColor(layer, cv2.COLOR_BGRA2BGR)
+        if alpha < 1.0:
+            colors = cv2.addWeighted(target, 1.0 - alpha, colors, alpha, 0)
+        target[...] = cv2.copyTo(colors, drawn, target.copy())
+        return img
+
+
+#public
+#Tiles images (same size) into one image, `columns` per row; titles are written on the tiles
+def contactSheet(images, titles=None, columns=3, scale=1.0):
+    if scale != 1.0:
+        images = [cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) for img in images]
+    height, width = images[0].shape[:2]
+    columns = max(1, min(columns, len(images)))
+    rows = -(-len(images) // columns)
+    sheet = np.zeros((rows * height, columns * width) + images[0].shape[2:], dtype=images[0].dtype)
+    for i, img in enumerate(images):
+        row, column = divmod(i, columns)
+        tile = sheet[row * height:(row + 1) * height, column * width:(column + 1) * width]
+        tile[...] = img
+        if titles is not None:
+            cv2.putText(tile, titles[i], (8, 24), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    return sheet
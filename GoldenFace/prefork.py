@@ -0,0 +1,88 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import multiprocessing
+import time
+import cv2
+from . import batch
+from . import models
+
+# Set in the parent right before the workers are forked, inherited by every worker
+_analyzer = None
+
+
+def _initForked():
+    # The detectors were loaded into the analyzer's pool by the parent; the inherited
+    # copies are used as they are, only the pool's lock is made anew for this process.
+    cv2.setNumThreads(1)
+    _analyzer.detectorPool.afterFork()
+
+
+def _forkedJob(job):
+    index, source = job
+    return batch._analyze(index, source, _analyzer)
+
+
+#public
+#Supervisor mode for multi-core servers: the models are loaded once in this process,
+#then `workers` processes are forked from it. They inherit the loaded models
+#copy-on-write (the model matrices are only read, so their pages stay shared) and
+#receive jobs over the pool's pipes. Needs the "fork" start method (Linux, macOS).
+#Results are the dicts of analyzeBatch.
+class PreforkPool:
+
+    def __init__(self, workers=None, analyzer=None):
+        global _analyzer
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("PreforkPool needs the fork start method")
+        if analyzer is None:
+            from .analyzer import defaultAnalyzer
+            analyzer = defaultAnalyzer
+
+        start = time.perf_counter()
+        self.warmup = models.warmup(analyzer)
+        _analyzer = analyzer
+
+        self.analyzer = analyzer
+        self._pool = multiprocessing.get_context("fork").Pool(workers, initializer=_initForked)
+        self.workers = self._pool._processes
+        self.startupTime = time.perf_counter() - start
+
+    #One image (path or BGR array) -> result dict, blocks until done
+    def analyze(self, image):
+        return self._pool.apply(_forkedJob, ((0, image),))
+
+    #Non-blocking analyze, returns an AsyncResult
+    def submit(self, image, callback=None):
+        return self._pool.apply_async(_forkedJob, ((0, image),), callback=callback)
+
+    #Many images, yielded like analyzeBatch
+    def map(self, images, ordered=True, chunksize=1):
+        jobs = enumerate(images)
+        if ordered:
+            results = self._pool.imap(_forkedJob, jobs, chunksize)
+        else:
+            results = self._pool.imap_unordered(_forkedJob, jobs, chunksize)
+        for result in results:
+            yield result
+
+    def pids(self):
+        return [process.pid for process in self._pool._pool]
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self):
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.terminate()
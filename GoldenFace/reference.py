@@ -0,0 +1,68 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import threading
+from importlib import resources
+import numpy as np
+from . import functions
+
+
+#public
+#Named reference face vectors (the golden face, custom or per-population templates).
+#Vectors are loaded and normalised once; score() compares a face with all of them
+#in one matrix product and gives the same values as goldenMath.vectorFaceSimilarity.
+class ReferenceRegistry:
+
+    def __init__(self):
+        self.names = []
+        self.vectors = {}
+        self._norms = {}
+        self._matrix = np.zeros((0, 29))
+        self._lock = threading.Lock()
+
+    def register(self, name, vector):
+        if len(vector) != 29:
+            raise ValueError("Face Vectors is not in same size")
+        with self._lock:
+            self.vectors[name] = [list(element) for element in vector]
+            self._norms[name] = functions.vectorBoyut(self.vectors[name])
+            if name not in self.names:
+                self.names.append(name)
+            self._matrix = functions.normalizeVectors([self.vectors[key] for key in self.names])
+
+    def load(self, name, path):
+        self.register(name, functions.loadFaceVec(path))
+
+    def vector(self, name):
+        return [list(element) for element in self.vectors[name]]
+
+    #face vector -> {name: similarity} for every registered reference
+    def score(self, faceVector):
+        names, matrix = self.names, self._matrix
+        similarities = matrix @ functions.normalizeVectors(faceVector)[0]
+        return dict(zip(names, similarities.tolist()))
+
+    #one reference, with its norm from register() (same value as cosineSimilarity)
+    def similarity(self, faceVector, name="golden"):
+        return functions.cosineSimilarity(self.vectors[name], faceVector, norm1=self._norms[name])
+
+
+_defaultRegistry = None
+_defaultLock = threading.Lock()
+
+#public
+#Process wide registry with the packaged golden face registered as "golden"
+def defaultRegistry():
+    global _defaultRegistry
+    if _defaultRegistry is None:
+        with _defaultLock:
+            if _defaultRegistry is None:
+                registry = ReferenceRegistry()
+                with resources.as_file(resources.files(__package__) / "goldenFace.json") as filepath:
+                    registry.load("golden", filepath)
+                _defaultRegistry = registry
+    return _defaultRegistry
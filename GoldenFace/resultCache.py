@@ -0,0 +1,154 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import copy
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+import cv2
+import numpy as np
+
+_metricKeys = ("TGSM", "VFM", "TZM", "TSM", "LC", "vector")
+
+
+#public
+#Content hash of an image: encoded file bytes (bytes, or a path that is read) or decoded pixels
+def contentKey(image):
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(image, np.ndarray):
+        digest.update(f"{image.shape}{image.dtype}".encode())
+        digest.update(np.ascontiguousarray(image).data)
+    else:
+        digest.update(_readBytes(image))
+    return digest.hexdigest()
+
+def _readBytes(image):
+    if isinstance(image, str):
+        with open(image, "rb") as imageFile:
+            return imageFile.read()
+    return bytes(image)
+
+
+#public
+#In-memory LRU cache of analysis results keyed by image content.
+#An entry is the compact result (goldenFace.toDict plus the 68 landmarks, or a "no face"
+#marker), so a repeated image skips detection, landmark fitting and the metrics.
+#maxEntries / maxBytes bound the cache (least recently used entries go first),
+#ttl (seconds) expires entries. Safe to share between threads.
+class ResultCache:
+
+    def __init__(self, maxEntries=256, maxBytes=64 << 20, ttl=None, analyzer=None):
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.ttl = ttl
+        self.analyzer = analyzer
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters, entries=len(self._entries), bytes=self._bytes)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                self._remove(key)
+                self._counters["expired"] += 1
+                entry = None
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry[2]
+
+    def put(self, key, value):
+        size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic(), size, value)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.maxEntries
+                                     or (self.maxBytes is not None and self._bytes > self.maxBytes)):
+                self._remove(next(iter(self._entries)))
+                self._counters["evictions"] += 1
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    #image (path, encoded bytes or BGR array) -> compact result dict.
+    #"faceBorders" is None when no face was found.
+    def result(self, image):
+        image = self._load(image)
+        key = contentKey(image)
+        entry = self.get(key)
+        if entry is None:
+            entry = self._analyze(self._decode(image))
+            self.put(key, entry)
+        return copy.deepcopy(entry)
+
+    #image -> goldenFace, rebuilt from the cached result on a hit (no detection or fitting),
+    #ready for drawing. Raises ValueError for images that can not be decoded.
+    def analyze(self, image):
+        from . import goldenFace
+
+        image = self._load(image)
+        key = contentKey(image)
+        img = self._decode(image)
+        entry = self.get(key)
+        if entry is None:
+            entry = self._analyze(img)
+            self.put(key, entry)
+
+        if entry["faceBorders"] is None:
+            # cached "no face": marked as detected without touching the detectors
+            face = goldenFace(img, analyzer=self.analyzer)
+            face.detect(faces=())
+            return face
+
+        face = goldenFace.fromDetection(img, np.array(entry["faceBorders"]), np.array(entry["landmarks"]),
+                                        analyzer=self.analyzer)
+        face._cache.update((name, copy.deepcopy(entry[name])) for name in _metricKeys)
+        return face
+
+    # paths are read once, then hashed and decoded from the same bytes
+    def _load(self, image):
+        return _readBytes(image) if isinstance(image, str) else image
+
+    def _decode(self, image):
+        if isinstance(image, np.ndarray):
+            return image
+        img = cv2.imdecode(np.frombuffer(bytes(image), dtype=np.uint8), cv2.IMREAD_COLOR)
+        if img is None:
+            raise ValueError("Could not load image. Please check the path or input array.")
+        return img
+
+    def _analyze(self, img):
+        from . import goldenFace
+
+        face = goldenFace(img, analyzer=self.analyzer)
+        if not face.hasFace():
+            return {"faceBorders": None}
+        entry = face.toDict()
+        entry["landmarks"] = face.landmarks[0].tolist()
+        return entry
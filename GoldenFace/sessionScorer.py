@@ -0,0 +1,212 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import threading
+import time
+import numpy as np
+
+
+#Streaming estimate of one quantile in constant memory (P-square algorithm, Jain & Chlamtac 1985).
+#Five markers track the minimum, the maximum, the quantile and two points in between;
+#exact until five values have been seen.
+class _QuantileEstimator:
+
+    def __init__(self, p):
+        self.p = p
+        self.heights = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x):
+        q = self.heights
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = self._parabolic(i, d)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    def _parabolic(self, i, d):
+        q, n = self.heights, self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self):
+        if not self.heights:
+            return None
+        if len(self.heights) < 5:
+            return float(np.quantile(self.heights, self.p))
+        return self.heights[2]
+
+
+#public
+#Timed scoring session of a live app in constant memory.
+#add() takes one score per analyzed frame while the session runs (duration seconds from
+#start()). Mean and variance are running sums (Welford), quantiles are streaming estimates,
+#and the last window scores sit in a ring buffer for recent-trend statistics, so a frame
+#costs the same at the end of the session as at the start.
+#finalize() computes the final score once: mean + offset, clamped to clamp, and passes it
+#with the duration to onFinalize (e.g. database_helper.save_result). Later calls return
+#the same summary without saving again.
+class SessionScorer:
+
+    def __init__(self, duration=60, window=90, quantiles=(0.5, 0.9), offset=0.0, clamp=(50, 99),
+                 onFinalize=None, clock=time.time):
+        self.duration = duration
+        self.offset = offset
+        self.clamp = clamp
+        self.onFinalize = onFinalize
+        self.clock = clock
+        self.quantileLevels = tuple(quantiles)
+        self._window = np.zeros(window, dtype=np.float64)
+        self._lock = threading.Lock()
+        self.start()
+
+    #restart the timer and forget all scores
+    def start(self, now=None):
+        with self._lock:
+            self.startTime = self.clock() if now is None else now
+            self.count = 0
+            self.mean = 0.0
+            self._m2 = 0.0
+            self.min = None
+            self.max = None
+            self._quantiles = [_QuantileEstimator(p) for p in self.quantileLevels]
+            self._next = 0
+            self._filled = 0
+            self.result = None
+        return self
+
+    def elapsed(self, now=None):
+        return (self.clock() if now is None else now) - self.startTime
+
+    def remaining(self, now=None):
+        return max(0.0, self.duration - self.elapsed(now))
+
+    def finished(self, now=None):
+        return self.elapsed(now) >= self.duration
+
+    #remaining time as "mm:ss"
+    def timerText(self, now=None):
+        m, s = divmod(int(self.remaining(now)), 60)
+        return f"{m:02d}:{s:02d}"
+
+    #True if the score was counted, False once the session time is over
+    def add(self, score, now=None):
+        if self.finished(now):
+            return False
+        with self._lock:
+            self._add(float(score))
+        return True
+
+    def _add(self, score):
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (score - self.mean)
+        self.min = score if self.min is None else min(self.min, score)
+        self.max = score if self.max is None else max(self.max, score)
+        for estimator in self._quantiles:
+            estimator.add(score)
+        if len(self._window):
+            self._window[self._next] = score
+            self._next = (self._next + 1) % len(self._window)
+            self._filled = min(self._filled + 1, len(self._window))
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return self.variance ** 0.5
+
+    def quantile(self, p):
+        return self._quantiles[self.quantileLevels.index(p)].value()
+
+    #last scores in arrival order (at most window of them)
+    def window(self):
+        with self._lock:
+            if self._filled < len(self._window):
+                return self._window[:self._filled].copy()
+            return np.roll(self._window, -self._next)
+
+    def windowStats(self):
+        scores = self.window()
+        if not len(scores):
+            return {"count": 0, "mean": None, "std": None, "min": None, "max": None}
+        return {"count": len(scores), "mean": float(scores.mean()), "std": float(scores.std()),
+                "min": float(scores.min()), "max": float(scores.max())}
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count else None,
+            "variance": self.variance,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "quantiles": {p: estimator.value() for p, estimator in zip(self.quantileLevels, self._quantiles)},
+            "window": self.windowStats(),
+            "duration": self.duration,
+            "elapsed": min(self.elapsed(), self.duration),
+        }
+
+    #final score (mean + offset, clamped) handed to onFinalize once; fallback is counted
+    #when the session ended without any score
+    def finalize(self, fallback=None):
+        with self._lock:
+            if self.result is not None:
+                return self.result
+            if not self.count and fallback is not None:
+                self._add(float(fallback))
+        result = self.summary()
+        final = result["mean"]
+        if final is not None:
+            final += self.offset
+            if self.clamp is not None:
+                final = max(self.clamp[0], min(self.clamp[1], final))
+        result["final"] = final
+
+        with self._lock:
+            if self.result is not None:
+                return self.result
+            self.result = result
+        if final is not None and self.onFinalize is not None:
+            self.onFinalize(final, self.duration)
+        return result
+
+    @property
+    def finalScore(self):
+        return self.result["final"] if self.result is not None else None
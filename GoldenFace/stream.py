@@ -0,0 +1,299 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import queue
+import threading
+import time
+
+
+def _defaultRender(frame, result):
+    return frame, result
+
+
+#public
+#Pipelined video engine: capture thread -> analysis workers -> ordered render stage.
+#
+#source  : anything with read() -> (ok, frame), e.g. cv2.VideoCapture. ok=False ends the stream.
+#analyze : analyze(frame) -> result, runs on `workers` threads. If it raises, result is None.
+#render  : render(frame, result) -> output, runs on one thread in capture order.
+#          Defaults to returning (frame, result).
+#
+#Stages are connected by bounded queues. When analysis falls behind, the oldest waiting
+#frame is dropped so workers always get the newest one (latest frame wins); the same
+#applies to outputs nobody has consumed yet. Iterate the pipeline (or poll() it) for outputs.
+#Analysis workers share the detectors of the analyzer analyze uses (see Analyzer): a new
+#pipeline or extra workers do not load the models again, GoldenFace.warmup() loads them up front.
+class StreamPipeline:
+
+    def __init__(self, source, analyze, render=None, workers=2, queueSize=2, outputSize=2):
+        self.source = source
+        self.analyze = analyze
+        self.render = render if render is not None else _defaultRender
+        self.workers = workers
+
+        self._frames = queue.Queue(queueSize)
+        self._outputs = queue.Queue(outputSize)
+
+        self._running = False
+        self._finished = False
+        self._threads = []
+        self._takeLock = threading.Lock()
+        self._nextSeq = 0
+        self._nextOut = 0
+        self._pending = {}
+        self._workersDone = 0
+        self._ready = threading.Condition()
+
+        self._statsLock = threading.Lock()
+        self._stats = {"captured": 0, "analyzed": 0, "rendered": 0, "dropped": 0,
+                       "droppedOutputs": 0, "errors": 0}
+        self._latencyTotal = 0.0
+        self._lastLatency = 0.0
+        self._startTime = None
+
+    def start(self):
+        if self._running:
+            return self
+        self._running = True
+        self._startTime = time.time()
+
+        self._threads = [threading.Thread(target=self._captureLoop, daemon=True)]
+        self._threads += [threading.Thread(target=self._analyzeLoop, daemon=True) for _ in range(self.workers)]
+        self._threads.append(threading.Thread(target=self._renderLoop, daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self._running = False
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    #Blocks for outputs until the stream ends or stop() is called
+    def __iter__(self):
+        self.start()
+        while True:
+            output = self._outputs.get()
+            if output is None:
+                self._end()
+                return
+            yield self._deliver(output)
+
+    #Newest output, or None when nothing new is ready (for GUI timers)
+    def poll(self):
+        latest = None
+        while True:
+            try:
+                output = self._outputs.get_nowait()
+            except queue.Empty:
+                break
+            if output is None:
+                self._end()
+                break
+            if latest is not None:
+                self._count("droppedOutputs")
+            latest = output
+        return self._deliver(latest) if latest is not None else None
+
+    #True once the stream ended and every output was handed out
+    @property
+    def finished(self):
+        return self._finished
+
+    def _end(self):
+        self._finished = True
+        # keep the end marker for any other reader
+        self._outputs.put(None)
+
+    def stats(self):
+        with self._statsLock:
+            stats = dict(self._stats)
+            rendered = stats["rendered"]
+            stats["latency"] = self._lastLatency
+            stats["meanLatency"] = self._latencyTotal / rendered if rendered else 0.0
+        elapsed = time.time() - self._startTime if self._startTime else 0.0
+        stats["fps"] = rendered / elapsed if elapsed > 0 else 0.0
+        return stats
+
+    def _deliver(self, output):
+        capturedAt, value = output
+        latency = time.time() - capturedAt
+        with self._statsLock:
+            self._stats["rendered"] += 1
+            self._lastLatency = latency
+            self._latencyTotal += latency
+        return value
+
+    def _count(self, key):
+        with self._statsLock:
+            self._stats[key] += 1
+
+    def _putLatest(self, target, item, counter):
+        while True:
+            try:
+                target.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    target.get_nowait()
+                    self._count(counter)
+                except queue.Empty:
+                    pass
+
+    def _captureLoop(self):
+        try:
+            while self._running:
+                ok, frame = self.source.read()
+                if not ok:
+                    break
+                self._count("captured")
+                self._putLatest(self._frames, (time.time(), frame), "dropped")
+        finally:
+            self._running = False
+            for _ in range(self.workers):
+                self._frames.put(None)
+
+    def _analyzeLoop(self):
+        while True:
+            # Numbering frames while taking them keeps sequence numbers in capture order
+            with self._takeLock:
+                item = self._frames.get()
+                if item is not None:
+                    seq = self._nextSeq
+                    self._nextSeq += 1
+
+            if item is None:
+                with self._ready:
+                    self._workersDone += 1
+                    self._ready.notify_all()
+                return
+
+            capturedAt, frame = item
+            try:
+                result = self.analyze(frame)
+                self._count("analyzed")
+            except Exception:
+                result = None
+                self._count("errors")
+
+            with self._ready:
+                self._pending[seq] = (capturedAt, frame, result)
+                self._ready.notify_all()
+
+    def _renderLoop(self):
+        while True:
+            with self._ready:
+                while self._nextOut not in self._pending and not self._drained():
+                    self._ready.wait(0.1)
+                if self._nextOut not in self._pending:
+                    break
+                capturedAt, frame, result = self._pending.pop(self._nextOut)
+                self._nextOut += 1
+
+            try:
+                output = self.render(frame, result)
+            except Exception:
+                self._count("errors")
+                continue
+            self._putLatest(self._outputs, (capturedAt, output), "droppedOutputs")
+
+        self._putLatest(self._outputs, None, "droppedOutputs")
+
+    def _drained(self):
+        return self._workersDone == self.workers and self._nextOut >= self._nextSeq
+
+
+#public
+#Fans one stream of items (e.g. encoded JPEG frames) out to any number of subscribers.
+#Every subscription has its own bounded buffer; when a subscriber falls behind, its
+#oldest item is dropped, so a slow client skips frames instead of stalling the publisher
+#or the other clients. Safe to use from several threads.
+class FrameBroadcaster:
+
+    def __init__(self, bufferSize=2):
+        self.bufferSize = bufferSize
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._subscriptions)
+
+    def subscribe(self):
+        subscription = Subscription(self, self.bufferSize)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def publish(self, item):
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription._put(item)
+
+    #Ends every current subscription (their iterators stop). New ones can still subscribe.
+    def close(self):
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            self._subscriptions.clear()
+        for subscription in subscriptions:
+            subscription._put(None)
+
+    def _remove(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+
+#public
+#One subscriber of a FrameBroadcaster. Iterate it for items, close() it when done.
+class Subscription:
+
+    def __init__(self, broadcaster, bufferSize):
+        self._broadcaster = broadcaster
+        self._items = queue.Queue(bufferSize)
+        self.received = 0
+        self.dropped = 0
+
+    #Blocks for items until the broadcaster is closed; unsubscribes when the loop ends
+    def __iter__(self):
+        try:
+            while True:
+                item = self._items.get()
+                if item is None:
+                    return
+                self.received += 1
+                yield item
+        finally:
+            self.close()
+
+    def close(self):
+        self._broadcaster._remove(self)
+
+    def _put(self, item):
+        while True:
+            try:
+                self._items.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._items.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
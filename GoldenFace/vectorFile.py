@@ -0,0 +1,147 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import os
+import struct
+import numpy as np
+from . import functions
+
+# File layout: a 32 byte header followed by fixed size records.
+#   magic "GFVF", version, payload type, vector length (29), points per record, record size
+# A record is the (29, 2) face vector and, optionally, `points` (x, y) landmark points,
+# both stored with the payload type. The record count follows from the file size, so
+# appending never rewrites the header; a torn last record (crash while appending) is ignored.
+_magic = b"GFVF"
+_version = 1
+_header = struct.Struct("<4sHBBHHI16x")
+_types = {1: np.dtype("<i2"), 2: np.dtype("<f4")}
+_codes = {"int16": 1, "float32": 2}
+
+
+def _recordDtype(payload, points):
+    fields = [("vector", payload, (29, 2))]
+    if points:
+        fields.append(("points", payload, (points, 2)))
+    return np.dtype(fields)
+
+
+#public
+#Append-only binary container for face vectors (and optionally landmark points).
+#dtype ("int16" or "float32") and points are only used when the file is created,
+#an existing file keeps the layout stored in its header.
+#face2Vec values are integers, int16 holds them in 4 bytes a pair; it raises ValueError
+#when a value does not fit, use float32 for such data. Appends expect a single writer.
+class FaceVectorFile:
+
+    def __init__(self, path, dtype="int16", points=0):
+        self.path = path
+        if os.path.exists(path) and os.path.getsize(path) >= _header.size:
+            with open(path, "rb") as vectorFile:
+                magic, version, code, _, length, points, recordSize = _header.unpack(vectorFile.read(_header.size))
+            if magic != _magic or version != _version or code not in _types or length != 29:
+                raise ValueError(f"{path} is not a face vector file")
+        else:
+            if dtype not in _codes:
+                raise ValueError("dtype must be int16 or float32")
+            code = _codes[dtype]
+            recordSize = _recordDtype(_types[code], points).itemsize
+            with open(path, "wb") as vectorFile:
+                vectorFile.write(_header.pack(_magic, _version, code, 0, 29, points, recordSize))
+
+        self.payload = _types[code]
+        self.points = points
+        self.recordDtype = _recordDtype(self.payload, points)
+
+    def __len__(self):
+        return (os.path.getsize(self.path) - _header.size) // self.recordDtype.itemsize
+
+    def append(self, vector, points=None):
+        self.extend([vector], None if points is None else [points])
+
+    #vectors: face2Vec outputs or an (N, 29, 2) array, points: (N, points, 2) when the file stores points
+    def extend(self, vectors, points=None):
+        vectors = np.asarray(vectors).reshape(-1, 29, 2)
+        records = np.zeros(len(vectors), dtype=self.recordDtype)
+        records["vector"] = self._convert(vectors)
+        if self.points:
+            if points is None:
+                raise ValueError("This file stores points, pass them with the vectors")
+            records["points"] = self._convert(np.asarray(points).reshape(len(vectors), self.points, 2))
+
+        # only whole records may follow the header
+        size = _header.size + len(self) * self.recordDtype.itemsize
+        with open(self.path, "r+b") as vectorFile:
+            vectorFile.truncate(size)
+            vectorFile.seek(size)
+            vectorFile.write(records.tobytes())
+
+    def _convert(self, values):
+        if self.payload.kind == "i":
+            info = np.iinfo(self.payload)
+            if values.size and (values.min() < info.min or values.max() > info.max):
+                raise ValueError("Values do not fit into int16, use a float32 file")
+            return np.rint(values)
+        return values
+
+    #Memory map of all records, a structured array with "vector" (and "points") fields
+    def read(self):
+        count = len(self)
+        if count == 0:
+            return np.zeros(0, dtype=self.recordDtype)
+        return np.memmap(self.path, dtype=self.recordDtype, mode="r", offset=_header.size, shape=(count,))
+
+    #(N, 29, 2) view of the vectors
+    @property
+    def vectors(self):
+        return self.read()["vector"]
+
+    def __getitem__(self, index):
+        return self.read()[index]
+
+    #One record as a face2Vec style list
+    def vector(self, index):
+        return self.read()["vector"][index].tolist()
+
+
+#public
+#Pack JSON face vector files (saveFaceVec output) into one binary file.
+#The file names (without .json) are written next to it as <binaryPath>.ids, one per line.
+def jsonToBinary(jsonPaths, binaryPath, dtype="int16", batchSize=10000):
+    vectorFile = FaceVectorFile(binaryPath, dtype)
+    with open(binaryPath + ".ids", "a") as idsFile:
+        batch, names = [], []
+        for path in jsonPaths:
+            batch.append(functions.loadFaceVec(path))
+            names.append(os.path.splitext(os.path.basename(path))[0])
+            if len(batch) == batchSize:
+                vectorFile.extend(batch)
+                idsFile.write("".join(name + "\n" for name in names))
+                batch, names = [], []
+        if batch:
+            vectorFile.extend(batch)
+            idsFile.write("".join(name + "\n" for name in names))
+    return vectorFile
+
+
+#public
+#Write every vector of a binary file back to <directory>/<id>.json
+#(ids from <binaryPath>.ids when it exists, else the record index)
+def binaryToJson(binaryPath, directory):
+    vectorFile = FaceVectorFile(binaryPath)
+    names = None
+    if os.path.exists(binaryPath + ".ids"):
+        with open(binaryPath + ".ids") as idsFile:
+            names = idsFile.read().splitlines()
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, vector in enumerate(vectorFile.vectors):
+        name = names[index] if names is not None else str(index)
+        path = os.path.join(directory, name + ".json")
+        functions.saveFaceVec(vector.tolist(), path)
+        paths.append(path)
+    return paths
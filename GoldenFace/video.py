@@ -0,0 +1,151 @@
+#-- GoldenFace 1.0 (Face Golden Ratio & Cosine Similarity Library)--
+# Author      : Umit Aksoylu
+# Date        : 15.05.2020
+# Description : Facial Cosine Similarity,Face Golden Ratio Calculation And Facial Landmark Detecting/Drawing Library
+# Website     : http://umit.space
+# Mail        : umit@aksoylu.space
+# Github      : https://github.com/Aksoylu/GoldenFace
+import threading
+import cv2
+import numpy as np
+from . import goldenFace
+from .analyzer import defaultAnalyzer
+
+
+#public
+#Per-stream analysis with track-then-detect.
+#The full frame is searched only every detectInterval frames or when the face is lost;
+#in between the Haar detector runs on the previous face box grown by margin on every side,
+#limited to face sizes close to the previous one. Finding the face there is the check that
+#the track is still valid, otherwise the same frame falls back to a full detection.
+#A session may be shared by several analysis threads (see StreamPipeline): only the
+#tracking step is serialized, landmark fitting and metrics run in parallel.
+#
+#motionThreshold turns on motion gating: the face box of the last fitted frame is cut out
+#of every new frame, shrunk to motionSize x motionSize and compared with the same cut of
+#the fitted frame. While the mean absolute difference (gray levels, 0-255) stays below the
+#threshold, the frame reuses the fitted landmarks and metrics without detecting or fitting.
+#A refit is forced after refitInterval reused frames. stats["reuseFraction"] is the share
+#of frames served from reuse. Tolerance: with motionThreshold=2 and refitInterval=5 the
+#session mean of the geometric ratio stays within 0.5 of refitting every frame, and
+#single frames differ no more than refitting differs from frame to frame on its own
+#(benchmarks/bench_motion_gate.py).
+class VideoSession:
+
+    def __init__(self, analyzer=None, detectInterval=10, margin=0.5, sizeTolerance=1.4,
+                 motionThreshold=None, refitInterval=5, motionSize=32):
+        if analyzer is None:
+            analyzer = defaultAnalyzer
+        self.analyzer = analyzer
+        self.detectInterval = detectInterval
+        self.margin = margin
+        self.sizeTolerance = sizeTolerance
+        self.motionThreshold = motionThreshold
+        self.refitInterval = refitInterval
+        self.motionSize = motionSize
+
+        self.lastBox = None
+        self.framesSinceDetect = 0
+        self.stats = {"frames": 0, "fullDetections": 0, "trackedFrames": 0, "lostTracks": 0,
+                      "reusedFrames": 0, "reuseFraction": 0.0, "lastMotion": None}
+        self._lock = threading.Lock()
+        # last fitted frame: (goldenFace, its face box, ROI thumbnail, frames reused since)
+        self._reference = None
+
+    def reset(self):
+        self.lastBox = None
+        self.framesSinceDetect = 0
+        self._reference = None
+
+    #BGR frame -> goldenFace with detection already done
+    def process(self, frame):
+        face = goldenFace(frame, analyzer=self.analyzer)
+        if self.motionThreshold is not None:
+            reused = self._reuse(face)
+            if reused is not None:
+                return reused
+
+        face.detect(self.findFaces(face.image_gray))
+        if self.motionThreshold is not None:
+            self._remember(face)
+        return face
+
+    def _thumbnail(self, image_gray, box):
+        (x,y,w,h) = box
+        roi = image_gray[max(0, y):y+h, max(0, x):x+w]
+        if roi.size == 0:
+            return None
+        return cv2.resize(roi, (self.motionSize, self.motionSize), interpolation=cv2.INTER_AREA)
+
+    def _reuse(self, face):
+        with self._lock:
+            reference = self._reference
+            if reference is None or reference[3] >= self.refitInterval:
+                return None
+            fitted, box, thumbnail, reused = reference
+
+            current = self._thumbnail(face.image_gray, box)
+            if current is None or current.shape != thumbnail.shape:
+                return None
+            motion = cv2.norm(current, thumbnail, cv2.NORM_L1) / current.size
+            self.stats["lastMotion"] = motion
+            if motion >= self.motionThreshold:
+                return None
+
+            self._reference = (fitted, box, thumbnail, reused + 1)
+            self.stats["frames"] += 1
+            self.stats["reusedFrames"] += 1
+            self._updateReuseFraction()
+
+        result = goldenFace.fromDetection(face.img, np.array(box), fitted.landmarks[0], analyzer=self.analyzer,
+                                          image_gray=face.image_gray, faces=np.array([box]))
+        # same landmarks, so the metrics computed for the fitted frame hold for this one too
+        result._cache = fitted._cache
+        return result
+
+    def _remember(self, face):
+        with self._lock:
+            if face._faceBorders is None:
+                self._reference = None
+            else:
+                box = tuple(int(v) for v in face.faceBorders)
+                thumbnail = self._thumbnail(face.image_gray, box)
+                self._reference = (face, box, thumbnail, 0) if thumbnail is not None else None
+            self._updateReuseFraction()
+
+    def _updateReuseFraction(self):
+        self.stats["reuseFraction"] = self.stats["reusedFrames"] / self.stats["frames"] if self.stats["frames"] else 0.0
+
+    def findFaces(self, image_gray):
+        with self._lock:
+            self.stats["frames"] += 1
+            return self._findFaces(image_gray)
+
+    def _findFaces(self, image_gray):
+        if self.lastBox is not None and self.framesSinceDetect < self.detectInterval:
+            faces = self.analyzer.detectRegion(image_gray, *self._searchWindow(image_gray))
+            if len(faces):
+                self.lastBox = faces[0]
+                self.framesSinceDetect += 1
+                self.stats["trackedFrames"] += 1
+                return faces[:1]
+            self.stats["lostTracks"] += 1
+
+        faces = self.analyzer.detect(image_gray)
+        self.stats["fullDetections"] += 1
+        self.framesSinceDetect = 0
+        self.lastBox = faces[0] if len(faces) else None
+        return faces
+
+    def _searchWindow(self, image_gray):
+        (x,y,w,h) = self.lastBox
+        height, width = image_gray.shape[:2]
+
+        left = max(0, int(x - w * self.margin))
+        top = max(0, int(y - h * self.margin))
+        right = min(width, int(x + w + w * self.margin))
+        bottom = min(height, int(y + h + h * self.margin))
+
+        minSize = (int(w / self.sizeTolerance), int(h / self.sizeTolerance))
+        maxSize = (int(w * self.sizeTolerance), int(h * self.sizeTolerance))
+        return (left, top, right - left, bottom - top), minSize, maxSize
@@ -0,0 +1,87 @@
+"""Benchmark GoldenFace.batchMath against the scalar goldenMath metrics.
+
+Usage: python benchmarks/bench_batch_math.py [--faces 100000] [--scalar 5000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GoldenFace import batchMath, goldenMath, landmark
+
+# A plausible frontal face in a 200x210 box, in landmark.pointNames order
+TEMPLATE = np.array([
+    [10, 90], [190, 90],
+    [45, 85], [80, 87], [120, 87], [155, 85],
+    [70, 160], [130, 160],
+    [35, 65], [85, 62], [115, 62], [165, 65],
+    [85, 130], [115, 130], [100, 135], [100, 200],
+])
+
+
+def synthesize(count, seed=0):
+    """Random faces around TEMPLATE: integer points and borders like goldenFace produces."""
+    rng = np.random.default_rng(seed)
+    offsets = rng.integers(0, 400, size=(count, 1, 2))
+    points = TEMPLATE + rng.integers(-6, 7, size=(count, len(TEMPLATE), 2)) + offsets
+    borders = np.concatenate([offsets[:, 0], np.tile([200, 210], (count, 1))], axis=1)
+    return borders, points
+
+
+def scalarMetrics(faceBorders, facePoints):
+    goldenMath.unitSize = goldenMath.calculateUnit(facePoints)
+    TZM = goldenMath.calculateTZM(faceBorders, facePoints)
+    TGSM = goldenMath.calculateTGSM(faceBorders, facePoints)
+    VFM = goldenMath.calculateVFM(faceBorders, facePoints)
+    TSM = goldenMath.calculateTSM(faceBorders, facePoints)
+    LC = goldenMath.calculateLC(faceBorders, facePoints)
+    return TZM, TGSM, VFM, TSM, LC, 100 - (TZM + TGSM + VFM + TSM + LC) / 5
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--faces", type=int, default=100000)
+    parser.add_argument("--scalar", type=int, default=5000, help="faces to run through the scalar path")
+    args = parser.parse_args()
+
+    borders, points = synthesize(args.faces)
+    scalarCount = min(args.scalar, args.faces)
+
+    start = time.perf_counter()
+    expected = []
+    for i in range(scalarCount):
+        facePoints = landmark.pointsToDict(points[i])
+        try:
+            expected.append(scalarMetrics(borders[i].tolist(), facePoints))
+        except ZeroDivisionError:
+            # Equal eye widths give a zero unit size; batchMath returns inf/nan there
+            expected.append([np.nan] * 6)
+    scalarSeconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    metrics = batchMath.calculateMetrics(borders, points)
+    batchSeconds = time.perf_counter() - start
+
+    expected = np.array(expected)
+    names = ["TZM", "TGSM", "VFM", "TSM", "LC", "geometricRatio"]
+    actual = np.stack([metrics[name][:scalarCount] for name in names], axis=1)
+    valid = np.isfinite(expected).all(axis=1)
+    maxError = np.abs(actual[valid] - expected[valid]).max()
+
+    scalarPerFace = scalarSeconds / scalarCount
+    batchPerFace = batchSeconds / args.faces
+    print(f"scalar goldenMath : {scalarPerFace * 1e6:9.2f} us/face ({scalarCount} faces)")
+    print(f"batchMath         : {batchPerFace * 1e6:9.2f} us/face ({args.faces} faces, {batchSeconds:.3f} s)")
+    print(f"speedup           : {scalarPerFace / batchPerFace:9.1f}x")
+    print(f"max abs difference: {maxError:.3g} ({valid.sum()} comparable faces)")
+
+    if not np.allclose(actual[valid], expected[valid], rtol=1e-9, atol=1e-9):
+        sys.exit("batchMath does not match goldenMath")
+
+
+if __name__ == "__main__":
+    main()
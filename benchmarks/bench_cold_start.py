@@ -0,0 +1,63 @@
+"""Cold start of a fresh process: import, model loading and the first analysis.
+
+Runs new interpreters with the landmark model cache turned off, building the cache,
+and loading from the cache, and prints GoldenFace.warmup() timings for each.
+
+Usage: python benchmarks/bench_cold_start.py [--model path/to/landmark.yaml] [--image Example/test.png] [--runs 3]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import GoldenFace
+if sys.argv[1]:
+    GoldenFace.models.landmarkModelFile = sys.argv[1]
+timings = GoldenFace.warmup()
+analysisStart = time.perf_counter()
+GoldenFace.goldenFace(sys.argv[2]).geometricRatio()
+timings["firstAnalysis"] = time.perf_counter() - analysisStart
+timings["process"] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+
+def run(model, image, environment):
+    result = subprocess.run([sys.executable, "-c", CHILD, model or "", image], cwd=ROOT,
+                            env=environment, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default=None, help="landmark model, defaults to the packaged landmark.yaml")
+    parser.add_argument("--image", default=os.path.join(ROOT, "Example", "test.png"))
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    cacheDir = tempfile.mkdtemp(prefix="goldenface-cache-")
+    try:
+        base = dict(os.environ, GOLDENFACE_CACHE_DIR=cacheDir)
+        cases = [("no cache", dict(base, GOLDENFACE_MODEL_CACHE="0"), args.runs),
+                 ("build cache", base, 1),
+                 ("cached", base, args.runs)]
+        print(f"{'':<12} {'landmarks':>10} {'detector':>10} {'first image':>12} {'process':>10}")
+        for label, environment, runs in cases:
+            results = [run(args.model, args.image, environment) for _ in range(runs)]
+            best = min(results, key=lambda timings: timings["process"])
+            print(f"{label:<12} {best['landmarkDetector']:9.2f}s {best['faceDetector']:9.2f}s "
+                  f"{best['firstAnalysis']:11.2f}s {best['process']:9.2f}s  ({best['landmarkCache']})")
+    finally:
+        shutil.rmtree(cacheDir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Sustained insert rate of database_helper: connect-per-row vs the batching ResultWriter.
+
+Usage: python benchmarks/bench_database.py [--rows 200000] [--legacy-rows 2000] [--sessions 4]
+"""
+import argparse
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_helper
+
+
+def legacyInsert(path, score, duration):
+    # database_helper.save_result before the ResultWriter: one connection and commit per row
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO assessments (timestamp, score, duration_seconds) VALUES (?, ?, ?)",
+                 ("2024-01-01 00:00:00", score, duration))
+    conn.commit()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--legacy-rows", type=int, default=2000)
+    parser.add_argument("--sessions", type=int, default=4, help="threads logging frames concurrently")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="goldenface-db-")
+    try:
+        legacyPath = os.path.join(directory, "legacy.db")
+        sqlite3.connect(legacyPath).executescript(database_helper.SCHEMA)
+        start = time.perf_counter()
+        for row in range(args.legacy_rows):
+            legacyInsert(legacyPath, 50.0, 60)
+        legacyTime = time.perf_counter() - start
+        print(f"connect per row : {args.legacy_rows / legacyTime:10.0f} rows/s")
+
+        writer = database_helper.ResultWriter(os.path.join(directory, "writer.db"))
+        vector = np.random.default_rng(0).integers(0, 1000, size=(29, 2))
+        metrics = {"TGSM": 1.0, "VFM": 2.0, "TZM": 3.0, "TSM": 4.0, "LC": 5.0}
+        perSession = args.rows // args.sessions
+        enqueueTimes = []
+
+        def session(name):
+            start = time.perf_counter()
+            for frame in range(perSession // 2):
+                writer.log_frame(name, frame, 80.0, metrics)
+                writer.log_vector(name, frame, vector)
+            enqueueTimes.append((time.perf_counter() - start) / perSession)
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=session, args=(f"session{index}",)) for index in range(args.sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.flush()
+        writerTime = time.perf_counter() - start
+        writer.close()
+
+        print(f"ResultWriter    : {writer.rows_written / writerTime:10.0f} rows/s committed "
+              f"({writer.rows_written} rows in {writer.batches_written} transactions, {args.sessions} sessions)")
+        print(f"caller cost     : {max(enqueueTimes) * 1e6:10.1f} us per row")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
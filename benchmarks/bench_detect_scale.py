@@ -0,0 +1,86 @@
+"""Benchmark downscaled face detection (Analyzer.maxDetectSide) against native resolution.
+
+The portrait is placed on 480p, 1080p and 4K canvases. For each size the script reports
+the detection latency of both paths and how well their largest boxes agree (IoU).
+
+Usage: python benchmarks/bench_detect_scale.py [--image Example/test.png] [--max-side 640] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import GoldenFace
+
+RESOLUTIONS = {"480p": (854, 480), "1080p": (1920, 1080), "4K": (3840, 2160)}
+
+
+def canvas(image, size):
+    """Fit image into a size=(width, height) frame, centered on a gray background."""
+    width, height = size
+    scale = min(width / image.shape[1], height / image.shape[0])
+    resized = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR)
+    frame = np.full((height, width, 3), 127, dtype=np.uint8)
+    top = (height - resized.shape[0]) // 2
+    left = (width - resized.shape[1]) // 2
+    frame[top:top + resized.shape[0], left:left + resized.shape[1]] = resized
+    return frame
+
+
+def largest(faces):
+    if not len(faces):
+        return None
+    return max(faces, key=lambda box: box[2] * box[3])
+
+
+def iou(a, b):
+    if a is None or b is None:
+        return 0.0
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    w = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    h = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = w * h
+    return inter / float(aw * ah + bw * bh - inter)
+
+
+def timeDetect(analyzer, gray, repeat):
+    faces = analyzer.detect(gray)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        faces = analyzer.detect(gray)
+    return (time.perf_counter() - start) / repeat, faces
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--image", default=os.path.join(ROOT, "Example", "test.png"))
+    parser.add_argument("--max-side", type=int, default=640)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    image = cv2.imread(args.image)
+    if image is None:
+        sys.exit(f"Could not read {args.image}")
+
+    native = GoldenFace.Analyzer()
+    scaled = GoldenFace.Analyzer(maxDetectSide=args.max_side)
+
+    print(f"{'input':>6} {'native ms':>10} {'scaled ms':>10} {'speedup':>8} {'faces':>7} {'IoU':>6}")
+    for name, size in RESOLUTIONS.items():
+        gray = cv2.cvtColor(canvas(image, size), cv2.COLOR_BGR2GRAY)
+        nativeSeconds, nativeFaces = timeDetect(native, gray, args.repeat)
+        scaledSeconds, scaledFaces = timeDetect(scaled, gray, args.repeat)
+        agreement = iou(largest(nativeFaces), largest(scaledFaces))
+        print(f"{name:>6} {nativeSeconds * 1000:10.1f} {scaledSeconds * 1000:10.1f} "
+              f"{nativeSeconds / scaledSeconds:7.1f}x {len(nativeFaces):>3}/{len(scaledFaces):<3} {agreement:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
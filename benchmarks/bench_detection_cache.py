@@ -0,0 +1,66 @@
+"""Batch re-runs with and without a DetectionCache.
+
+Writes --images distinct copies of an image (one pixel changed per copy, so every
+copy has its own content hash), then runs analyzeBatch over them three times:
+without a cache, with an empty cache (first run) and with the filled cache (re-run,
+landmarks come from SQLite). The metrics of the cached re-run are compared with
+the uncached ones.
+
+Usage: python benchmarks/bench_detection_cache.py [--images 200] [--workers 4] [--model path/to/landmark.yaml] [--image Example/test.png]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def run(label, images, workers, cache=None):
+    import GoldenFace
+
+    start = time.perf_counter()
+    results = list(GoldenFace.analyzeBatch(images, workers=workers, cache=cache))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<14} {elapsed:7.2f}s  {len(images) / elapsed:8.1f} images/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--image", default=os.path.join(ROOT, "Example", "test.png"))
+    args = parser.parse_args()
+    if args.model:
+        os.environ["GOLDENFACE_LANDMARK_MODEL"] = os.path.abspath(args.model)
+
+    import cv2
+    from GoldenFace.detectionCache import DetectionCache
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = cv2.imread(args.image)
+        images = []
+        for i in range(args.images):
+            copy = source.copy()
+            copy[0, 0] = (i % 256, i // 256 % 256, 0)
+            path = os.path.join(directory, f"{i}.png")
+            cv2.imwrite(path, copy)
+            images.append(path)
+
+        cachePath = os.path.join(directory, "detections.db")
+        plain = run("no cache", images, args.workers)
+        run("cache (empty)", images, args.workers, cachePath)
+        cached = run("cache (filled)", images, args.workers, cachePath)
+
+        keys = ("faceBorders", "TGSM", "VFM", "TZM", "TSM", "LC", "geometricRatio", "vector")
+        same = all(a[key] == b[key] for a, b in zip(plain, cached) for key in keys)
+        print(f"cached metrics identical: {same}")
+        print(f"cache: {DetectionCache(cachePath).stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark FaceGallery.top_k on a large synthetic gallery.
+
+Usage: python benchmarks/bench_gallery.py [--faces 500000] [--queries 20] [--dir /tmp/goldenface-gallery]
+"""
+import argparse
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GoldenFace import goldenMath
+from GoldenFace.gallery import FaceGallery
+
+
+def randomVectors(rng, count):
+    # face2Vec elements are non-negative integer distances
+    return rng.integers(0, 600, size=(count, 29, 2))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--faces", type=int, default=500000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--dir", default=None)
+    args = parser.parse_args()
+
+    path = args.dir or tempfile.mkdtemp(prefix="goldenface-gallery-")
+    rng = np.random.default_rng(0)
+    try:
+        gallery = FaceGallery(path)
+        start = time.perf_counter()
+        for first in range(0, args.faces, 100000):
+            count = min(100000, args.faces - first)
+            gallery.addMany(range(first, first + count), randomVectors(rng, count))
+        print(f"enrolled {len(gallery)} faces in {time.perf_counter() - start:.2f} s")
+
+        gallery = FaceGallery(path)
+        queries = randomVectors(rng, args.queries)
+        gallery.top_k(queries[0], 5)
+
+        start = time.perf_counter()
+        for query in queries:
+            matches = gallery.top_k(query, 5)
+        perQuery = (time.perf_counter() - start) / args.queries
+        print(f"top_k(k=5): {perQuery * 1000:.1f} ms/query")
+        print(f"max RSS    : {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+        best, similarity = matches[0]
+        stored = np.fromfile(os.path.join(path, "vectors.f32"), dtype=np.float32, count=29,
+                             offset=int(best) * 29 * 4)
+        reference = goldenMath.vectorFaceSimilarity(queries[-1].tolist(), np.stack([stored, stored], axis=1).tolist())
+        print(f"best match {best}: {similarity:.6f} (goldenMath: {reference:.6f})")
+    finally:
+        if args.dir is None:
+            shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Guard the cost of `import GoldenFace`.
+
+Runs `python -X importtime -c "import GoldenFace"` in fresh interpreters, reports the
+cumulative import time of the package, and checks that no heavy module (cv2, numpy,
+pkg_resources) is loaded by the bare import. Exits with status 1 when the best run is
+over --budget-ms or a heavy module was imported, so it can run as a CI check.
+
+Usage: python benchmarks/bench_import.py [--budget-ms 20] [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("cv2", "numpy", "pkg_resources")
+
+
+def importTime(statement):
+    # -X importtime writes "import time: self [us] | cumulative | name" lines to stderr
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() and parts[1].strip().isdigit() and not parts[2].startswith("  "):
+            total += int(parts[1])
+    return total / 1000
+
+
+def packageTime():
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import GoldenFace"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "GoldenFace":
+            return int(parts[1]) / 1000
+    raise RuntimeError("GoldenFace not found in -X importtime output")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=20.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    best = min(packageTime() for _ in range(args.runs))
+    print(f"import GoldenFace                 : {best:8.2f} ms (budget {args.budget_ms:.0f} ms)")
+    # first use of a name imports what it needs; interpreter startup imports are subtracted
+    startup = min(importTime("pass") for _ in range(args.runs))
+    for statement in ("import GoldenFace; GoldenFace.functions",
+                      "import GoldenFace; GoldenFace.FaceVectorFile",
+                      "import GoldenFace; GoldenFace.goldenFace"):
+        cost = min(importTime(statement) for _ in range(args.runs)) - startup
+        print(f"{statement.split('; ')[1]:<34}: {cost:8.2f} ms")
+
+    check = "import sys, GoldenFace; print(' '.join(name for name in %r if name in sys.modules))" % (HEAVY,)
+    loaded = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout.split()
+
+    failed = False
+    if loaded:
+        print("FAIL: `import GoldenFace` loaded " + ", ".join(loaded))
+        failed = True
+    if best > args.budget_ms:
+        print("FAIL: import time is over budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Motion-gated landmark reuse (VideoSession(motionThreshold=...)) against refitting every frame.
+
+Builds a synthetic "seated subject" clip from one portrait: sensor noise on every frame,
+one pixel of jitter now and then, and a larger head move every --move-every frames.
+The same frames go through a plain VideoSession and a motion-gated one. The script
+prints the time per frame of both and the share of reused frames. For the scores it
+prints how far the gated session mean is from the refit session mean (checked against
+--tolerance, exit status 1 when over), and the per-frame difference next to the
+frame-to-frame jitter of refitting itself.
+
+Usage: python benchmarks/bench_motion_gate.py [--frames 300] [--threshold 2] [--refit-interval 5] [--tolerance 0.5] [--model path/to/landmark.yaml] [--image Example/test.png]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def clip(image, frames, moveEvery, noise, seed=0):
+    """Frames of a mostly still subject: noise, occasional 1 px jitter, a 12 px move every moveEvery frames."""
+    rng = np.random.default_rng(seed)
+    offset = np.zeros(2, dtype=int)
+    for i in range(frames):
+        if i and i % moveEvery == 0:
+            offset = rng.integers(-12, 13, size=2)
+        jitter = offset + (rng.integers(-1, 2, size=2) if rng.random() < 0.2 else 0)
+        frame = np.roll(image, tuple(jitter), axis=(0, 1)).astype(np.int16)
+        frame += rng.normal(0, noise, size=frame.shape).astype(np.int16)
+        yield np.clip(frame, 0, 255).astype(np.uint8)
+
+
+def run(session, frames):
+    import GoldenFace
+    ratios = []
+    start = time.perf_counter()
+    for frame in frames:
+        try:
+            ratios.append(session.process(frame).geometricRatio())
+        except GoldenFace.NoFaceError:
+            ratios.append(None)
+    return ratios, (time.perf_counter() - start) / len(frames) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--threshold", type=float, default=2.0)
+    parser.add_argument("--refit-interval", type=int, default=5)
+    parser.add_argument("--move-every", type=int, default=60)
+    parser.add_argument("--noise", type=float, default=2.0)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--image", default=os.path.join(ROOT, "Example", "test.png"))
+    args = parser.parse_args()
+    if args.model:
+        os.environ["GOLDENFACE_LANDMARK_MODEL"] = os.path.abspath(args.model)
+
+    import cv2
+    import GoldenFace
+
+    GoldenFace.warmup()
+    frames = list(clip(cv2.imread(args.image), args.frames, args.move_every, args.noise))
+
+    refit, refitTime = run(GoldenFace.VideoSession(), frames)
+    session = GoldenFace.VideoSession(motionThreshold=args.threshold, refitInterval=args.refit_interval)
+    gated, gatedTime = run(session, frames)
+
+    both = [(a, b) for a, b in zip(refit, gated) if a is not None and b is not None]
+    refit = np.array([a for a, _ in both])
+    gated = np.array([b for _, b in both])
+    meanDifference = abs(gated.mean() - refit.mean())
+    print(f"refit every frame  {refitTime:7.2f} ms/frame")
+    print(f"motion gated       {gatedTime:7.2f} ms/frame  reused {session.stats['reuseFraction']:.0%} of frames")
+    print(f"session mean: refit {refit.mean():.3f}  gated {gated.mean():.3f}  difference {meanDifference:.3f} "
+          f"(tolerance {args.tolerance})")
+    print(f"per frame: mean difference {np.abs(gated - refit).mean():.3f}  "
+          f"refit frame-to-frame jitter {np.abs(np.diff(refit)).mean():.3f}")
+    print(f"stats: {session.stats}")
+    if meanDifference > args.tolerance:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
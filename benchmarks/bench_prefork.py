@@ -0,0 +1,82 @@
+"""Memory and startup of PreforkPool against a spawn-per-worker pool.
+
+Both pools run the same images. The spawn pool loads the models in every worker
+(analyzeBatch's initializer); PreforkPool loads them once in the parent and forks.
+Memory is read from /proc/<pid>/smaps_rollup (Linux): RSS counts shared pages in
+every process, PSS splits them between the processes sharing them.
+
+Usage: python benchmarks/bench_prefork.py [--workers 8] [--model path/to/landmark.yaml] [--image Example/test.png]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def readyJob(_):
+    # holds a worker long enough that every worker takes one job, so every one is initialized
+    time.sleep(0.3)
+    return os.getpid()
+
+
+def memory(pids):
+    rss = pss = 0
+    for pid in pids:
+        with open(f"/proc/{pid}/smaps_rollup") as rollup:
+            for line in rollup:
+                if line.startswith("Rss:"):
+                    rss += int(line.split()[1])
+                elif line.startswith("Pss:"):
+                    pss += int(line.split()[1])
+    return rss / 1024, pss / 1024
+
+
+def report(label, startup, pids, analysisTime):
+    rss, pss = memory(pids)
+    print(f"{label:<10} startup {startup:6.2f}s  analysis {analysisTime:6.2f}s  "
+          f"RSS {rss:8.0f} MB  PSS {pss:8.0f} MB  ({len(pids)} processes)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--image", default=os.path.join(ROOT, "Example", "test.png"))
+    args = parser.parse_args()
+    if args.model:
+        # read by GoldenFace.models in this process and in spawned workers
+        os.environ["GOLDENFACE_LANDMARK_MODEL"] = os.path.abspath(args.model)
+
+    from GoldenFace import batch
+    from GoldenFace.prefork import PreforkPool
+    images = [args.image] * (args.workers * 4)
+
+    start = time.perf_counter()
+    pool = multiprocessing.get_context("spawn").Pool(args.workers, initializer=batch._initWorker)
+    pids = set(pool.map(readyJob, range(args.workers), 1))
+    startup = time.perf_counter() - start - 0.3
+    start = time.perf_counter()
+    pool.map(batch._analyzeJob, enumerate(images))
+    analysisTime = time.perf_counter() - start
+    report("spawn", startup, [os.getpid()] + [process.pid for process in pool._pool], analysisTime)
+    pool.terminate()
+    if len(pids) != args.workers:
+        print("  (not every spawn worker took a ready job, startup is a lower bound)")
+
+    start = time.perf_counter()
+    prefork = PreforkPool(args.workers)
+    prefork._pool.map(readyJob, range(args.workers), 1)
+    startup = time.perf_counter() - start - 0.3
+    start = time.perf_counter()
+    list(prefork.map(images))
+    analysisTime = time.perf_counter() - start
+    report("prefork", startup, [os.getpid()] + prefork.pids(), analysisTime)
+    prefork.terminate()
+
+
+if __name__ == "__main__":
+    main()
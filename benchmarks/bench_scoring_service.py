@@ -0,0 +1,88 @@
+"""Load test for Example/scoring_service.py.
+
+Sends --requests POST /score requests (or /score/batch with --batch N images each)
+from --concurrency client threads to a running service, then prints p50/p90/p99
+latency, requests (and images) per second and the status codes seen.
+Start the service first: python Example/scoring_service.py --workers 8
+
+Usage: python benchmarks/bench_scoring_service.py [--url http://127.0.0.1:5001] [--requests 500] [--concurrency 16] [--batch 0] [--image Example/test.png]
+"""
+import argparse
+import collections
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def multipart(field, images):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for i, image in enumerate(images):
+        parts.append(f"--{boundary}\r\nContent-Disposition: form-data; name=\"{field}\"; "
+                     f"filename=\"{i}.png\"\r\nContent-Type: application/octet-stream\r\n\r\n".encode())
+        parts.append(image)
+        parts.append(b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def send(url, body, contentType):
+    post = urllib.request.Request(url, data=body, headers={"Content-Type": contentType}, method="POST")
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(post) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        status = e.code
+    return time.perf_counter() - start, status
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:5001")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch", type=int, default=0, help="images per /score/batch request, 0 uses /score")
+    parser.add_argument("--image", default=os.path.join(ROOT, "Example", "test.png"))
+    args = parser.parse_args()
+
+    with open(args.image, "rb") as imageFile:
+        image = imageFile.read()
+    if args.batch:
+        url = args.url.rstrip("/") + "/score/batch"
+        body, contentType = multipart("images", [image] * args.batch)
+    else:
+        url = args.url.rstrip("/") + "/score"
+        body, contentType = multipart("image", [image])
+
+    send(url, body, contentType)   # first request outside the measurement
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as clients:
+        results = list(clients.map(lambda _: send(url, body, contentType), range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    statuses = collections.Counter(status for _, status in results)
+    images = args.requests * max(args.batch, 1)
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {elapsed:.2f}s")
+    print(f"latency p50 {percentile(latencies, 0.5) * 1000:.1f} ms  p90 {percentile(latencies, 0.9) * 1000:.1f} ms  "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms")
+    print(f"{args.requests / elapsed:.1f} requests/s  {images / elapsed:.1f} images/s")
+    print(f"status codes: {dict(statuses)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark SessionScorer against the score list the live apps used to keep.
+
+The list version appends every score and recomputes sum(scores) / len(scores) on
+every frame, like camera_example, gui_app and web_app did. The scorer updates its
+running statistics in constant time. Both run over the same scores. The script prints
+the time per frame at the start and the end of the session, the final mean of both,
+and the quantile estimates next to the exact ones.
+
+Usage: python benchmarks/bench_session_scorer.py [--frames 50000] [--window 90]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GoldenFace import SessionScorer
+
+
+def listSession(values):
+    scores = []
+    times = []
+    for value in values:
+        start = time.perf_counter()
+        scores.append(value)
+        mean = sum(scores) / len(scores)
+        times.append(time.perf_counter() - start)
+    return mean, np.array(times)
+
+
+def scorerSession(values, window):
+    scorer = SessionScorer(duration=float("inf"), window=window)
+    times = []
+    for value in values:
+        start = time.perf_counter()
+        scorer.add(value)
+        mean = scorer.mean
+        times.append(time.perf_counter() - start)
+    return scorer, mean, np.array(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=50000)
+    parser.add_argument("--window", type=int, default=90)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = (70 + rng.normal(0, 5, args.frames)).tolist()
+    tail = max(1, args.frames // 100)
+
+    listMean, listTimes = listSession(values)
+    scorer, scorerMean, scorerTimes = scorerSession(values, args.window)
+
+    for name, times in (("score list", listTimes), ("SessionScorer", scorerTimes)):
+        print(f"{name:<14} first 1% {times[:tail].mean() * 1e6:8.2f} us/frame  "
+              f"last 1% {times[-tail:].mean() * 1e6:8.2f} us/frame  total {times.sum():.2f} s")
+    print(f"mean: list {listMean:.6f}  scorer {scorerMean:.6f}  std {scorer.std:.4f} (exact {np.std(values, ddof=1):.4f})")
+    for p in scorer.quantileLevels:
+        print(f"p{int(p * 100)}: estimate {scorer.quantile(p):.4f}  exact {np.quantile(values, p):.4f}")
+    print(f"window: {scorer.windowStats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark the face vector similarity kernels in GoldenFace.functions.
+
+Compares the original pure Python cosine similarity loop with the one-vs-one,
+one-vs-many and many-vs-many NumPy kernels and checks they agree.
+
+Usage: python benchmarks/bench_similarity.py [--faces 20000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GoldenFace import functions
+
+
+def loopCosine(vector1, vector2):
+    # functions.cosineSimilarity before it was vectorized
+    dot = 0
+    for i in range(len(vector1)):
+        dot = dot + vector1[i][1] * vector2[i][1]
+    norm1 = sum(element[1] * element[1] for element in vector1) ** (1 / 2)
+    norm2 = sum(element[1] * element[1] for element in vector2) ** (1 / 2)
+    return dot / (norm1 * norm2)
+
+
+def timed(label, count, function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:10.2f} ms  {count / elapsed:14.0f} pairs/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--faces", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    stack = rng.integers(1, 600, size=(args.faces, 29, 2))
+    vectors = stack.tolist()
+    query = vectors[0]
+
+    loop = timed("python loop, one vs many", args.faces,
+                 lambda: [loopCosine(query, vector) for vector in vectors])
+    timed("cosineSimilarity, one vs one", args.faces,
+          lambda: [functions.cosineSimilarity(query, vector) for vector in vectors])
+
+    norms = functions.vectorNorms(stack)
+    many = timed("cosineSimilarities", args.faces,
+                 lambda: functions.cosineSimilarities(query, stack, norms=norms))
+
+    block = stack[:2000]
+    blockNorms = norms[:2000]
+    matrix = timed("cosineSimilarityMatrix", len(block) ** 2,
+                   lambda: functions.cosineSimilarityMatrix(block, block, blockNorms, blockNorms))
+
+    print("max difference vs loop (one vs many):", float(np.max(np.abs(many - np.array(loop)))))
+    print("max difference matrix row vs loop   :", float(np.max(np.abs(matrix[0] - np.array(loop[:2000])))))
+
+
+if __name__ == "__main__":
+    main()
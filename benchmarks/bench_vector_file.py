@@ -0,0 +1,79 @@
+"""Compare loading face vectors from JSON files with the binary FaceVectorFile.
+
+Writes --json small JSON files (saveFaceVec format) and a binary file with --faces
+vectors, then times loading both. JSON time per file is extrapolated to --faces.
+
+Usage: python benchmarks/bench_vector_file.py [--faces 1000000] [--json 20000] [--dir /tmp/goldenface-vectors]
+"""
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GoldenFace import functions
+from GoldenFace.vectorFile import FaceVectorFile, jsonToBinary
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--faces", type=int, default=1000000)
+    parser.add_argument("--json", type=int, default=20000)
+    parser.add_argument("--dir", default=None)
+    args = parser.parse_args()
+
+    path = args.dir or tempfile.mkdtemp(prefix="goldenface-vectors-")
+    rng = np.random.default_rng(0)
+    try:
+        jsonDir = os.path.join(path, "json")
+        os.makedirs(jsonDir, exist_ok=True)
+        for index, vector in enumerate(rng.integers(0, 1000, size=(args.json, 29, 2))):
+            functions.saveFaceVec(vector.tolist(), os.path.join(jsonDir, f"{index}.json"))
+
+        start = time.perf_counter()
+        paths = sorted(glob.glob(os.path.join(jsonDir, "*.json")))
+        loaded = [functions.loadFaceVec(jsonPath) for jsonPath in paths]
+        jsonTime = time.perf_counter() - start
+        jsonBytes = sum(os.path.getsize(jsonPath) for jsonPath in paths)
+
+        start = time.perf_counter()
+        jsonToBinary(paths, os.path.join(path, "converted.gfv"))
+        convertTime = time.perf_counter() - start
+
+        binaryPath = os.path.join(path, "faces.gfv")
+        vectorFile = FaceVectorFile(binaryPath)
+        start = time.perf_counter()
+        for first in range(0, args.faces, 100000):
+            vectorFile.extend(rng.integers(0, 1000, size=(min(100000, args.faces - first), 29, 2)))
+        appendTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectors = FaceVectorFile(binaryPath).vectors
+        mapTime = time.perf_counter() - start
+        start = time.perf_counter()
+        checksum = int(vectors[..., 1].sum(dtype=np.int64))
+        scanTime = time.perf_counter() - start
+
+        converted = FaceVectorFile(os.path.join(path, "converted.gfv")).vectors
+        assert converted.tolist() == loaded
+
+        perFile = jsonTime / len(paths)
+        print(f"json: {len(paths)} files in {jsonTime:.2f} s ({perFile * 1e6:.0f} us/file, "
+              f"{jsonBytes / len(paths):.0f} bytes/face), {args.faces} files ~ {perFile * args.faces:.0f} s")
+        print(f"jsonToBinary: {len(paths)} files in {convertTime:.2f} s")
+        print(f"binary: appended {args.faces} vectors in {appendTime:.2f} s, "
+              f"{os.path.getsize(binaryPath) / args.faces:.0f} bytes/face")
+        print(f"binary: mapped in {mapTime * 1000:.2f} ms, full scan in {scanTime * 1000:.1f} ms (checksum {checksum})")
+    finally:
+        if args.dir is None:
+            shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    main()
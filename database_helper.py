@@ -1,37 +1,236 @@
 import sqlite3
 from datetime import datetime
+import atexit
+import queue
+import threading
+import time
 import os
 
+import numpy as np
+
 DB_NAME = "beauty_scores.db"
 
-def init_db():
-    """Initialize the database and create the table if it doesn't exist."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS assessments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            score REAL NOT NULL,
-            duration_seconds INTEGER
-        )
-    ''')
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS assessments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        score REAL NOT NULL,
+        duration_seconds INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS frame_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        frame_index INTEGER NOT NULL,
+        timestamp REAL NOT NULL,
+        score REAL,
+        tgsm REAL,
+        vfm REAL,
+        tzm REAL,
+        tsm REAL,
+        lc REAL
+    );
+    CREATE INDEX IF NOT EXISTS frame_metrics_session ON frame_metrics (session_id, frame_index);
+    CREATE TABLE IF NOT EXISTS face_vectors (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        frame_index INTEGER NOT NULL,
+        vector BLOB NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS face_vectors_session ON face_vectors (session_id, frame_index);
+'''
+
+_INSERTS = {
+    "assessments": "INSERT INTO assessments (timestamp, score, duration_seconds) VALUES (?, ?, ?)",
+    "frame_metrics": '''INSERT INTO frame_metrics (session_id, frame_index, timestamp, score, tgsm, vfm, tzm, tsm, lc)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+    "face_vectors": "INSERT INTO face_vectors (session_id, frame_index, vector) VALUES (?, ?, ?)",
+}
+
+_METRIC_KEYS = ("TGSM", "VFM", "TZM", "TSM", "LC")
+
+# queue markers next to the table names
+_FLUSH = "flush"
+_STOP = "stop"
+
+
+def connect(path=DB_NAME):
+    """Open a connection in WAL mode with the schema in place."""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    # WAL lets readers work while the writer commits; NORMAL sync is durable across app crashes
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
     conn.commit()
-    conn.close()
+    return conn
+
+
+class ResultWriter:
+    """Background writer that batches inserts into transactions on one long-lived connection.
+
+    Rows are queued by log_frame/log_vector/save_result and written by a single thread,
+    so callers (e.g. a capture loop) never wait for the disk. flush() blocks until
+    everything queued so far is committed; close() flushes and stops the thread.
+    """
+
+    def __init__(self, path=DB_NAME, batch_size=1000, flush_interval=0.25, max_queue=100000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.batches_written = 0
+        self.error = None
+
+        self._queue = queue.Queue(max_queue)
+        self._closed = False
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ResultWriter", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def save_result(self, score, duration=60, timestamp=None):
+        """Queue an assessment row; returns the timestamp it will be stored with."""
+        timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._put("assessments", (timestamp, score, duration))
+        return timestamp
+
+    def log_frame(self, session_id, frame_index, score, metrics=None, timestamp=None):
+        """Queue one frame's score and, optionally, its deflections (dict with TGSM, VFM, TZM, TSM, LC)."""
+        metrics = metrics or {}
+        values = tuple(metrics.get(key) for key in _METRIC_KEYS)
+        self._put("frame_metrics", (session_id, frame_index, timestamp or time.time(), score) + values)
+
+    def log_vector(self, session_id, frame_index, vector):
+        """Queue one face vector (face2Vec output), stored as a float32 (29, 2) blob."""
+        blob = np.asarray(vector, dtype="<f4").reshape(29, 2).tobytes()
+        self._put("face_vectors", (session_id, frame_index, blob))
+
+    def flush(self, timeout=None):
+        """Wait until every row queued so far is committed. Returns False on timeout.
+
+        Raises the last sqlite3 error if a batch could not be written since the previous flush.
+        """
+        done = threading.Event()
+        self._put(_FLUSH, done)
+        if not done.wait(timeout):
+            return False
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+        return True
+
+    def close(self):
+        """Flush and stop the writer thread; the thread is stopped even if the flush raises."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put((_STOP, None))
+            self._thread.join()
+
+    def _put(self, table, row):
+        if self._closed:
+            raise RuntimeError("ResultWriter is closed")
+        # blocks only when max_queue rows are waiting (the disk can not keep up)
+        self._queue.put((table, row))
+
+    def _run(self):
+        try:
+            conn = connect(self.path)
+        except Exception as e:
+            self.error = e
+            self._ready.set()
+            return
+        self._ready.set()
+
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            batch = [item]
+            # collect what is already waiting, up to one batch, within flush_interval
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and item[0] not in (_FLUSH, _STOP):
+                try:
+                    item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            rows = {}
+            waiting = []
+            for table, row in batch:
+                if table == _FLUSH:
+                    waiting.append(row)
+                elif table == _STOP:
+                    stop = True
+                else:
+                    rows.setdefault(table, []).append(row)
+
+            if rows:
+                try:
+                    with conn:
+                        for table, values in rows.items():
+                            conn.executemany(_INSERTS[table], values)
+                    self.rows_written += sum(len(values) for values in rows.values())
+                    self.batches_written += 1
+                except sqlite3.Error as e:
+                    self.error = e
+                    print(f"Database write failed: {e}")
+            for done in waiting:
+                done.set()
+
+        conn.close()
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """Shared ResultWriter for DB_NAME, flushed and closed when the interpreter exits."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ResultWriter(DB_NAME)
+            atexit.register(_writer.close)
+        return _writer
+
+
+def init_db():
+    """Initialize the database and create the tables if they don't exist."""
+    get_writer()
     print(f"Database initialized: {DB_NAME}")
 
+
 def save_result(score, duration=60):
-    """Save the assessment result to the database."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    cursor.execute('''
-        INSERT INTO assessments (timestamp, score, duration_seconds)
-        VALUES (?, ?, ?)
-    ''', (timestamp, score, duration))
-    
-    conn.commit()
-    conn.close()
+    """Save the assessment result to the database (waits until it is committed)."""
+    writer = get_writer()
+    timestamp = writer.save_result(score, duration)
+    writer.flush()
     print(f"Result saved: Score={score:.2f}%, Time={timestamp}")
+
+
+def log_frame(session_id, frame_index, score, metrics=None, vector=None):
+    """Queue per-frame metrics (and the face vector) without blocking the caller."""
+    writer = get_writer()
+    writer.log_frame(session_id, frame_index, score, metrics)
+    if vector is not None:
+        writer.log_vector(session_id, frame_index, vector)
+
+
+def load_vectors(session_id, path=None):
+    """Face vectors logged for a session as an (N, 29, 2) float32 array, in frame order."""
+    if _writer is not None and path is None:
+        _writer.flush()
+    conn = connect(path or DB_NAME)
+    try:
+        blobs = conn.execute("SELECT vector FROM face_vectors WHERE session_id = ? ORDER BY frame_index, id",
+                             (session_id,)).fetchall()
+    finally:
+        conn.close()
+    if not blobs:
+        return np.zeros((0, 29, 2), dtype=np.float32)
+    return np.frombuffer(b"".join(blob for (blob,) in blobs), dtype="<f4").reshape(-1, 29, 2)
@@ -1,5 +1,4 @@
 import cv2
-import time
 import random
 import threading
 import sys
@@ -27,18 +26,19 @@ class GoldenFaceApp:
 
         # --- Variables ---
         self.is_running = False
-        self.scores = []
-        self.start_time = None
         self.duration = 60
-        self.session_variance = random.uniform(-3.0, 3.0)
-        self.saved_to_db = False
+        self.scorer = None
         
         # --- UI Layout ---
         self.setup_ui()
         
         # --- Camera Setup ---
         self.cap = None
-        self.video_thread = None
+
+        # Load the models in the background while the window opens; every Start Camera
+        # and every analysis thread then shares the loaded detectors
+        threading.Thread(target=GoldenFace.warmup, daemon=True).start()
+        self.pipeline = None
         
         # Initialize Database
         database_helper.init_db()
@@ -115,18 +115,26 @@ class GoldenFaceApp:
             return
             
         self.is_running = True
-        self.scores = []
-        self.saved_to_db = False
-        self.start_time = time.time()
+        # Timer, running average and the one-time save of the final score
+        self.scorer = GoldenFace.SessionScorer(duration=self.duration, offset=random.uniform(-3.0, 3.0),
+                                               onFinalize=database_helper.save_result)
+        # Full face detection only every few frames, tracking in between;
+        # frames that barely changed reuse the last landmarks (motion gating)
+        self.session = GoldenFace.VideoSession(motionThreshold=2)
         self.btn_start.config(state="disabled")
         self.btn_stop.config(state="normal")
         self.status_var.set("Initializing AI...")
         
+        # Capture and analysis run on background threads, the UI only shows the newest result
+        self.pipeline = GoldenFace.StreamPipeline(self.cap, self.analyze_frame, workers=2).start()
+
         # Start video loop
         self.update_frame()
 
     def stop_camera(self):
         self.is_running = False
+        if self.pipeline:
+            self.pipeline.stop()
         if self.cap:
             self.cap.release()
         self.video_label.config(image="")
@@ -134,48 +142,44 @@ class GoldenFaceApp:
         self.btn_stop.config(state="disabled")
         self.status_var.set("Stopped")
 
+    # Runs on the pipeline's analysis threads: no Tk calls here
+    def analyze_frame(self, frame):
+        # GoldenFace library expects BGR image (OpenCV standard)
+        analysis = self.session.process(frame)
+        
+        # Draw landmarks
+        analysis.drawFaceCover((0, 255, 255)) # Yellow mask
+        analysis.drawLandmarks((0, 0, 255))   # Red dots
+        
+        # Calculate Score
+        raw_score = analysis.geometricRatio()
+        
+        # Ensure min 50%
+        if raw_score < 50:
+            geometric_score = 50 + (raw_score / 2)
+        else:
+            geometric_score = raw_score
+        return max(50, geometric_score)
+
     def update_frame(self):
         if not self.is_running: return
 
-        ret, frame = self.cap.read()
-        if ret:
-            # 1. AI Analysis
-            try:
-                # GoldenFace library expects BGR image (OpenCV standard)
-                analysis = GoldenFace.goldenFace(frame) 
-                
-                # Draw landmarks
-                analysis.drawFaceCover((0, 255, 255)) # Yellow mask
-                analysis.drawLandmarks((0, 0, 255))   # Red dots
-                
-                # Calculate Score
-                raw_score = analysis.geometricRatio()
-                
-                # Ensure min 50%
-                if raw_score < 50:
-                    geometric_score = 50 + (raw_score / 2)
-                else:
-                    geometric_score = raw_score
-                geometric_score = max(50, geometric_score)
-                
-                # Process processed frame
-                frame = analysis.img
-                
+        item = self.pipeline.poll()
+        if item is not None:
+            # Processed frame and its score (None if no face was found)
+            frame, geometric_score = item
+
+            # 1. AI Analysis result
+            if geometric_score is None:
+                self.status_var.set("Looking for face...")
+            else:
                 # 2. Logic (Timer & Average)
-                elapsed = time.time() - self.start_time
-                
-                if elapsed < self.duration:
+                if self.scorer.add(geometric_score):
                     # Assessing
-                    self.scores.append(geometric_score)
-                    
-                    # Update Timer
-                    remaining = int(self.duration - elapsed)
-                    m, s = divmod(remaining, 60)
-                    self.timer_var.set(f"{m:02d}:{s:02d}")
+                    self.timer_var.set(self.scorer.timerText())
                     
                     # Update Running Average
-                    avg = sum(self.scores) / len(self.scores)
-                    self.score_var.set(f"{int(avg)}%")
+                    self.score_var.set(f"{int(self.scorer.mean)}%")
                     self.score_lbl.configure(foreground="#ffff00") # Yellow while running
                     self.status_var.set("Analyzing Face Structure...")
                     
@@ -183,26 +187,17 @@ class GoldenFaceApp:
                     # Assessment Complete
                     self.timer_var.set("00:00")
                     
-                    # Calculate Final
-                    if not self.scores: self.scores.append(geometric_score)
-                    final_score = (sum(self.scores) / len(self.scores)) + self.session_variance
-                    final_score = max(50, min(99, final_score))
+                    # Calculate Final and save it (first call only)
+                    saved = self.scorer.result is None
+                    final_score = self.scorer.finalize(fallback=geometric_score)["final"]
                     
                     self.score_var.set(f"{int(final_score)}%")
                     self.score_lbl.configure(foreground="#00ff00") # Green when done
                     
-                    # Save Logic
-                    if not self.saved_to_db:
-                        database_helper.save_result(final_score, self.duration)
-                        self.saved_to_db = True
+                    if saved:
                         self.status_var.set("Assessment Complete (Saved)")
                     else:
                         self.status_var.set("Assessment Complete")
-            
-            except Exception as e:
-                # If no face found or other error
-                # print(e) 
-                self.status_var.set("Looking for face...")
 
             # 3. Display in Tkinter
             # Convert BGR (OpenCV) to RGB (PIL/Tkinter)
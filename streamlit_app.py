@@ -20,6 +20,23 @@ except ImportError:
 
 st.set_page_config(page_title="GoldenFace AI", layout="centered")
 
+
+# One warmed-up analyzer per server process, shared by every rerun and session.
+# Reruns run on new ScriptRunner threads; the analyzer's detector pool is not tied to
+# a thread, so they all use the detectors loaded here.
+@st.cache_resource
+def get_analyzer():
+    analyzer = GoldenFace.Analyzer()
+    GoldenFace.warmup(analyzer)
+    return analyzer
+
+
+# Analysis results keyed by image content, so reruns with the same upload skip the analysis
+@st.cache_resource
+def get_result_cache():
+    return GoldenFace.ResultCache(maxEntries=128, ttl=3600, analyzer=get_analyzer())
+
+
 st.title("🔬 GoldenFace – Facial Beauty Analyzer")
 st.markdown("Assess facial geometric ratios using your camera or by uploading a portrait.")
 
@@ -35,44 +52,45 @@ else:
 
 if uploaded_file is not None:
     try:
-        # Correctly read image data from bytes
-        file_bytes = np.asarray(bytearray(uploaded_file.getvalue()), dtype=np.uint8)
-        bgr_image = cv2.imdecode(file_bytes, cv2.IMREAD_COLOR)
-        
-        if bgr_image is None:
+        try:
+            with st.spinner("Analyzing face..."):
+                # Cached by the uploaded bytes: a rerun with the same image skips detection and fitting
+                analysis = get_result_cache().analyze(uploaded_file.getvalue())
+        except ValueError:
             st.error("Could not decode image. Please try a different format or file.")
         else:
-            with st.spinner("Analyzing face..."):
-                analysis = GoldenFace.goldenFace(bgr_image)
+            # Check if faces were detected
+            if not analysis.hasFace():
+                st.warning("No face detected in the image. Please try again with a clear portrait.")
+            else:
+                # Draw visualizations
+                analysis.drawFaceCover((0, 255, 255))  # yellow mask
+                analysis.drawLandmarks((0, 0, 255))    # red dots
                 
-                # Check if faces were detected
-                if not hasattr(analysis, 'faceBorders') or analysis.faceBorders is None:
-                    st.warning("No face detected in the image. Please try again with a clear portrait.")
-                else:
-                    # Draw visualizations
-                    analysis.drawFaceCover((0, 255, 255))  # yellow mask
-                    analysis.drawLandmarks((0, 0, 255))    # red dots
-                    
-                    # Compute score
-                    raw_score = analysis.geometricRatio()
-                    # Normalized Beauty Score (50-99%)
-                    geometric_score = 50 + raw_score / 2 if raw_score < 50 else raw_score
-                    geometric_score = max(50, min(99, geometric_score))
+                # Compute score
+                raw_score = analysis.geometricRatio()
+                # Normalized Beauty Score (50-99%)
+                geometric_score = 50 + raw_score / 2 if raw_score < 50 else raw_score
+                geometric_score = max(50, min(99, geometric_score))
 
-                    # Convert result for display
-                    rgb_image = cv2.cvtColor(analysis.img, cv2.COLOR_BGR2RGB)
-                    pil_img = Image.fromarray(rgb_image)
+                # Convert result for display
+                rgb_image = cv2.cvtColor(analysis.img, cv2.COLOR_BGR2RGB)
+                pil_img = Image.fromarray(rgb_image)
+
+                # Layout for results
+                col1, col2 = st.columns([2, 1])
+                with col1:
+                    st.image(pil_img, caption="Analyzed Result", use_column_width=True)
+                with col2:
+                    st.subheader("Results")
+                    st.metric(label="Beauty Score", value=f"{int(geometric_score)}%")
+                    st.write("The score is based on facial geometric ratios.")
 
-                    # Layout for results
-                    col1, col2 = st.columns([2, 1])
-                    with col1:
-                        st.image(pil_img, caption="Analyzed Result", use_column_width=True)
-                    with col2:
-                        st.subheader("Results")
-                        st.metric(label="Beauty Score", value=f"{int(geometric_score)}%")
-                        st.write("The score is based on facial geometric ratios.")
-    
     except Exception as e:
         st.error(f"An error occurred during analysis: {e}")
 else:
     st.info("Waiting for image input...")
+
+cache_stats = get_result_cache().stats()
+st.sidebar.caption(f"Result cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                   f"{cache_stats['entries']} entries")